@@ -0,0 +1,104 @@
+"""
+Benchmarks of blob serialization with airspeed velocity (asv).
+Run from the repository root, e.g. ``asv run --python=same --set-commit-hash HEAD``.
+"""
+
+import datetime
+
+import numpy as np
+
+import datajoint as dj
+from datajoint.blob import MatCell, MatStruct, pack, unpack
+
+
+def _cell(n):
+    cell = np.empty((n, 10), dtype=object)
+    for i in range(cell.size):
+        cell.flat[i] = float(i)
+    return cell.view(MatCell)
+
+
+def _struct(n):
+    rng = np.random.default_rng(0)
+    return np.array(
+        [(rng.standard_normal(10), "trial %d" % i, float(i)) for i in range(n)],
+        dtype=[("trace", "O"), ("label", "O"), ("onset", "O")],
+    ).view(MatStruct)
+
+
+def _recarray(n):
+    rng = np.random.default_rng(0)
+    rec = np.empty(n, dtype=[("x", "f8"), ("y", "f4"), ("id", "i8"), ("flag", "?")])
+    rec["x"], rec["y"] = rng.standard_normal(n), rng.standard_normal(n)
+    rec["id"], rec["flag"] = np.arange(n), rng.random(n) > 0.5
+    return rec.view(np.recarray)
+
+
+def _nested(n):
+    return [
+        {
+            "id": i,
+            "name": "entry %d" % i,
+            "values": [float(i), float(i) / 2, None],
+            "tags": ("a", "b"),
+            "meta": {"ok": True, "count": i % 7},
+        }
+        for i in range(n)
+    ]
+
+
+def _nested_dict(n):
+    return {str(i): [i, float(i), None, (True, "x")] for i in range(n)}
+
+
+def _datetimes(n):
+    start = datetime.datetime(2024, 1, 1)
+    return {
+        "python": [start + datetime.timedelta(seconds=i) for i in range(n)],
+        "numpy": np.datetime64("2024-01-01") + np.arange(n).astype("timedelta64[s]"),
+    }
+
+
+# payloads of a few megabytes or ~10^4 elements; names are stable benchmark parameters
+PAYLOADS = {
+    "numeric": lambda: np.random.default_rng(0).integers(0, 1000, (500, 500)) * 0.5,
+    "complex": lambda: np.exp(1j * np.linspace(0, 100, 250_000)).reshape(500, 500),
+    "char": lambda: np.array(list("the quick brown fox " * 10_000), dtype="c").reshape(
+        -1, 1000
+    ),
+    "cell": lambda: _cell(2000),
+    "struct": lambda: _struct(2000),
+    "recarray": lambda: _recarray(100_000),
+    "nested": lambda: _nested(2000),
+    "nested_dict": lambda: _nested_dict(20_000),
+    "datetime": lambda: _datetimes(10_000),
+}
+
+
+class BlobSuite:
+    """pack and unpack of each payload, compressed and uncompressed"""
+
+    params = (list(PAYLOADS), [True, False])
+    param_names = ["payload", "compress"]
+
+    def setup(self, payload, compress):
+        dj.config["enable_python_native_blobs"] = True
+        self.obj = PAYLOADS[payload]()
+        self.blob = pack(self.obj, compress=compress)
+
+    def time_pack(self, payload, compress):
+        pack(self.obj, compress=compress)
+
+    def time_unpack(self, payload, compress):
+        unpack(self.blob)
+
+    def peakmem_pack(self, payload, compress):
+        pack(self.obj, compress=compress)
+
+    def peakmem_unpack(self, payload, compress):
+        unpack(self.blob)
+
+    def track_size(self, payload, compress):
+        return len(self.blob)
+
+    track_size.unit = "bytes"
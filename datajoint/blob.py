@@ -5,10 +5,18 @@ compatibility with Matlab-based serialization implemented by mYm.
 
 import collections
 import datetime
+import importlib
+import os
+import pickle
+import shutil
+import stat
+import struct
+import sys
+import tempfile
 import uuid
 import zlib
 from decimal import Decimal
-from itertools import repeat
+from itertools import chain, repeat
 
 import numpy as np
 
@@ -54,10 +62,289 @@ serialize_lookup = {
 }
 
 
-compression = {b"ZL123\0": zlib.decompress}
+def _import_codec_module(name, package):
+    try:
+        return importlib.import_module(name)
+    except ImportError:
+        raise DataJointError(
+            "The {package} package is required for this blob codec: "
+            "pip install {package}".format(package=package)
+        ) from None
+
+
+def _zstd_compress(data, level):
+    zstd = _import_codec_module("zstandard", "zstandard")
+    return zstd.ZstdCompressor(level=3 if level is None else level).compress(data)
+
+
+def _zstd_decompress(data):
+    return (
+        _import_codec_module("zstandard", "zstandard")
+        .ZstdDecompressor()
+        .decompress(data)
+    )
+
+
+def _lz4_compress(data, level):
+    lz4 = _import_codec_module("lz4.frame", "lz4")
+    return lz4.compress(data, compression_level=level or 0, store_size=True)
+
+
+def _lz4_decompress(data):
+    return _import_codec_module("lz4.frame", "lz4").decompress(data)
+
+
+def _blosc_compress(data, level):
+    blosc = _import_codec_module("blosc", "blosc")
+    return blosc.compress(
+        data, typesize=8, clevel=5 if level is None else level, cname="zstd"
+    )
+
+
+def _blosc_decompress(data):
+    return _import_codec_module("blosc", "blosc").decompress(data)
+
+
+def _is_sparse(obj):
+    # scipy is imported when obj is a scipy.sparse matrix or array
+    sparse = sys.modules.get("scipy.sparse")
+    return sparse is not None and sparse.issparse(obj)
+
+
+def _import_sparse():
+    try:
+        return importlib.import_module("scipy.sparse")
+    except ImportError:
+        raise DataJointError(
+            "The scipy package is required to unpack sparse arrays: pip install scipy"
+        ) from None
+
+
+# compression codecs: name -> (prefix, compress(data, level), decompress(data))
+codecs = {
+    "zlib": (
+        b"ZL123\0",
+        lambda data, level: zlib.compress(data, -1 if level is None else level),
+        zlib.decompress,
+    ),
+    "zstd": (b"ZSTD1\0", _zstd_compress, _zstd_decompress),
+    "lz4": (b"LZ4F1\0", _lz4_compress, _lz4_decompress),
+    "blosc": (b"BLOSC\0", _blosc_compress, _blosc_decompress),
+}
+
+compression = {prefix: decompress for prefix, _, decompress in codecs.values()}
+
+# functions(data, size) that decompress only the first size bytes, used to inspect headers
+partial_decompression = {
+    b"ZL123\0": lambda data, size: zlib.decompressobj().decompress(data, size),
+    b"ZSTD1\0": lambda data, size: _import_codec_module("zstandard", "zstandard")
+    .ZstdDecompressor()
+    .stream_reader(data)
+    .read(size),
+    b"LZ4F1\0": lambda data, size: _import_codec_module("lz4.frame", "lz4")
+    .LZ4FrameDecompressor()
+    .decompress(data, max_length=size),
+}
+
+
+def _zlib_compress_stream(chunks, level, size):
+    compressor = zlib.compressobj(-1 if level is None else level)
+    for chunk in chunks:
+        yield compressor.compress(chunk)
+    yield compressor.flush()
+
+
+def _zlib_decompress_stream(chunks):
+    decompressor = zlib.decompressobj()
+    for chunk in chunks:
+        yield decompressor.decompress(chunk)
+    yield decompressor.flush()
+
+
+def _zstd_compress_stream(chunks, level, size):
+    zstd = _import_codec_module("zstandard", "zstandard")
+    compressor = zstd.ZstdCompressor(level=3 if level is None else level).compressobj(
+        size=size
+    )
+    for chunk in chunks:
+        yield compressor.compress(chunk)
+    yield compressor.flush()
+
+
+def _zstd_decompress_stream(chunks):
+    zstd = _import_codec_module("zstandard", "zstandard")
+    decompressor = zstd.ZstdDecompressor().decompressobj()
+    for chunk in chunks:
+        yield decompressor.decompress(chunk)
+
+
+def _lz4_compress_stream(chunks, level, size):
+    lz4 = _import_codec_module("lz4.frame", "lz4")
+    compressor = lz4.LZ4FrameCompressor(compression_level=level or 0)
+    yield compressor.begin(source_size=size)
+    for chunk in chunks:
+        yield compressor.compress(chunk)
+    yield compressor.flush()
+
+
+def _lz4_decompress_stream(chunks):
+    decompressor = _import_codec_module("lz4.frame", "lz4").LZ4FrameDecompressor()
+    for chunk in chunks:
+        yield decompressor.decompress(chunk)
+
+
+# generators(chunks, level, size) and (chunks) that (de)compress a stream of chunks with
+# bounded memory, used by pack_to and unpack_from. Other codecs process the whole blob.
+stream_compression = {
+    b"ZL123\0": _zlib_compress_stream,
+    b"ZSTD1\0": _zstd_compress_stream,
+    b"LZ4F1\0": _lz4_compress_stream,
+}
+
+stream_decompression = {
+    b"ZL123\0": _zlib_decompress_stream,
+    b"ZSTD1\0": _zstd_decompress_stream,
+    b"LZ4F1\0": _lz4_decompress_stream,
+}
+
+
+def register_codec(
+    name,
+    prefix,
+    compress,
+    decompress,
+    partial_decompress=None,
+    compress_stream=None,
+    decompress_stream=None,
+):
+    """
+    Register a compression codec for blobs.
+
+    :param name: the name of the codec used in dj.config["blob.codec"], store specs, and
+        attribute comments
+    :param prefix: unique bytes, ending in a zero byte, that mark blobs compressed by the codec
+    :param compress: function(data, level) returning the compressed bytes. level may be None.
+    :param decompress: function(data) returning the decompressed bytes
+    :param partial_decompress: optional function(data, size) returning the first size bytes of
+        the decompressed data
+    :param compress_stream: optional generator function(chunks, level, size) yielding the
+        compressed data of an iterable of chunks whose total length is size
+    :param decompress_stream: optional generator function(chunks) yielding the decompressed
+        data of an iterable of compressed chunks
+    """
+    if not prefix.endswith(b"\0") or prefix in (b"mYm\0", b"dj0\0"):
+        raise DataJointError("Invalid prefix {!r} for codec {}".format(prefix, name))
+    if prefix in compression and codecs.get(name, (None,))[0] != prefix:
+        raise DataJointError("Codec prefix {!r} is already registered".format(prefix))
+    codecs[name] = (prefix, compress, decompress)
+    compression[prefix] = decompress
+    for registry, function in (
+        (partial_decompression, partial_decompress),
+        (stream_compression, compress_stream),
+        (stream_decompression, decompress_stream),
+    ):
+        if function is None:
+            registry.pop(prefix, None)
+        else:
+            registry[prefix] = function
+
+
+def _byte_shuffle(data, dtype):
+    return data.reshape(-1, dtype.itemsize).T.ravel()
+
+
+def _byte_unshuffle(data, dtype):
+    return data.reshape(dtype.itemsize, -1).T.ravel()
+
+
+def _bit_shuffle(data, dtype):
+    # transpose the bits of groups of 8 elements; trailing elements are left in place
+    n = data.size // (8 * dtype.itemsize) * 8 * dtype.itemsize
+    bits = np.unpackbits(
+        data[:n].reshape(-1, dtype.itemsize), axis=1, bitorder="little"
+    )
+    shuffled = np.packbits(bits.T, axis=1, bitorder="little").ravel()
+    return np.concatenate((shuffled, data[n:]))
+
+
+def _bit_unshuffle(data, dtype):
+    n = data.size // (8 * dtype.itemsize) * 8 * dtype.itemsize
+    bits = np.unpackbits(
+        data[:n].reshape(8 * dtype.itemsize, -1), axis=1, bitorder="little"
+    )
+    unshuffled = np.packbits(bits.T, axis=1, bitorder="little").ravel()
+    return np.concatenate((unshuffled, data[n:]))
+
+
+def _delta(data, dtype):
+    values = data.view(dtype)
+    return np.diff(values, prepend=dtype.type(0)).view(np.uint8)
+
+
+def _undelta(data, dtype):
+    return np.cumsum(data.view(dtype), dtype=dtype).view(np.uint8)
+
+
+# lossless pre-filters for numeric arrays: name -> (id, filter, unfilter, applies to dtype)
+# filters map the bytes of the array's data (uint8 ndarray) to bytes of the same length
+array_filters = {
+    "shuffle": (1, _byte_shuffle, _byte_unshuffle, lambda dtype: dtype.itemsize > 1),
+    "bitshuffle": (2, _bit_shuffle, _bit_unshuffle, lambda dtype: True),
+    "delta": (3, _delta, _undelta, lambda dtype: dtype.kind in "iu"),
+}
+array_filter_names = {v[0]: k for k, v in array_filters.items()}
+
+# names of the data structure codes reported by inspect
+structure_names = {
+    "A": "array",
+    "a": "array",
+    "c": "array",
+    "P": "sparse",
+    "s": "sparse",
+    "p": "pickle",
+    "S": "struct",
+    "C": "cell",
+    "F": "recarray",
+    "\xff": "None",
+    "\x01": "tuple",
+    "\x02": "list",
+    "\x03": "set",
+    "\x04": "dict",
+    "\x05": "str",
+    "\x06": "bytes",
+    "\x07": "list",
+    "\x0a": "int",
+    "\x0b": "bool",
+    "\x0c": "complex",
+    "\x0d": "float",
+    "d": "Decimal",
+    "t": "datetime",
+    "u": "UUID",
+}
+
+# python scalar types whose homogeneous sequences are packed as typed arrays:
+# type -> (data structure code of the scalar type, dtype)
+compact_sequence_types = {
+    int: (b"\x0a", np.dtype("int64")),
+    float: (b"\x0d", np.dtype("float64")),
+    bool: (b"\x0b", np.dtype("bool")),
+}
+compact_sequence_dtypes = {
+    code[0]: dtype for code, dtype in compact_sequence_types.values()
+}
 
 bypass_serialization = False  # runtime setting to bypass blob (en|de)code
 
+# blobs streamed by pack_to are buffered in memory up to this size and in temporary files
+# beyond it
+spool_size = 1 << 24
+
+# little-endian formats of header fields
+_u8, _u16, _u32, _u64 = (struct.Struct(f) for f in ("<B", "<H", "<I", "<Q"))
+_i32, _i64 = struct.Struct("<i"), struct.Struct("<q")
+_bool, _f64 = struct.Struct("<?"), struct.Struct("<d")
+_u8x2, _u32x2, _f64x2 = (struct.Struct(f) for f in ("<2B", "<2I", "<2d"))
+
 # runtime setting to read integers as 32-bit to read blobs created by the 32-bit
 # version of the mYm library for MATLAB
 use_32bit_dims = False
@@ -83,11 +370,61 @@ class MatStruct(np.recarray):
     pass
 
 
+class _FileSink:
+    """
+    A seekable binary file in place of the bytearray to which Blob.pack appends its output
+    """
+
+    def __init__(self, fileobj):
+        self._file = fileobj
+        self._start = fileobj.tell()
+        self._size = 0
+
+    def __len__(self):
+        return self._size
+
+    def __iadd__(self, data):
+        data = memoryview(data)
+        self._file.write(data)
+        self._size += data.nbytes
+        return self
+
+    def __setitem__(self, index, data):
+        # overwrite a reserved range, e.g. a length prefix
+        self._file.seek(self._start + (index.start or 0))
+        self._file.write(data)
+        self._file.seek(self._start + self._size)
+
+
+def _resolve_codec(codec, level):
+    """
+    :return: (prefix, compress, level) of the codec, by default from dj.config
+    """
+    if codec is None:
+        codec = config["blob.codec"]
+        if level is None:
+            level = config["blob.compression_level"]
+    try:
+        prefix, compressor, _ = codecs[codec]
+    except KeyError:
+        raise DataJointError(
+            'Unknown blob codec "{codec}". Use one of {names}'.format(
+                codec=codec, names=", ".join(codecs)
+            )
+        )
+    return prefix, compressor, level
+
+
 class Blob:
-    def __init__(self, squeeze=False):
+    def __init__(self, squeeze=False, filters=()):
         self._squeeze = squeeze
+        self._filters = filters
         self._blob = None
         self._pos = 0
+        self._sink = None
+        self._compression = (False, None, None)  # (compress, codec, level) of pack
+        self._segments = False  # True when parts of the blob are compressed separately
+        self._compact_sequences = False  # dj.config["blob.compact_sequences"] of pack
         self.protocol = None
 
     def set_dj0(self):
@@ -99,6 +436,37 @@ class Blob:
 
         self.protocol = b"dj0\0"  # when using new blob features
 
+    def _write(self, *parts):
+        """append bytes-like parts to the output of pack"""
+        for part in parts:
+            self._sink += part
+
+    def _write_data(self, array):
+        """
+        append the data of a numeric array in column-major order, copying at most 16 MiB at a
+        time when the array is not already in column-major order
+        """
+        data = (
+            array.T
+        )  # the column-major order of array is the row-major order of array.T
+        if data.ndim == 0 or data.flags.c_contiguous:
+            self._sink += memoryview(
+                np.ascontiguousarray(data).reshape(-1).view(np.uint8)
+            )
+            return
+        step = max(1, (1 << 24) // (data[0].nbytes or 1))
+        for i in range(0, len(data), step):
+            self._sink += memoryview(
+                np.ascontiguousarray(data[i : i + step]).reshape(-1).view(np.uint8)
+            )
+
+    def _pack_with_length(self, obj):
+        """pack obj preceded by the length of its encoding as uint64"""
+        pos = len(self._sink)
+        self._sink += bytes(8)
+        self.pack_blob(obj)
+        self._sink[pos : pos + 8] = np.uint64(len(self._sink) - pos - 8).tobytes()
+
     def squeeze(self, array, convert_to_scalar=True):
         """
         Simplify the input array - squeeze out all singleton dimensions.
@@ -110,18 +478,21 @@ class Blob:
         return array.item() if array.ndim == 0 and convert_to_scalar else array
 
     def unpack(self, blob):
+        """
+        Deserialize a blob.
+        Uncompressed numeric arrays are returned as read-only views into the blob without
+        copying their data. The blob may be bytes, bytearray, or memoryview.
+        """
         self._blob = blob
         try:
             # decompress
-            prefix = next(
-                p for p in compression if self._blob[self._pos :].startswith(p)
-            )
+            prefix = next(p for p in compression if self._startswith(p))
         except StopIteration:
             pass  # assume uncompressed but could be unrecognized compression
         else:
             self._pos += len(prefix)
-            blob_size = self.read_value()
-            blob = compression[prefix](self._blob[self._pos :])
+            blob_size = self.read_length()
+            blob = compression[prefix](memoryview(self._blob)[self._pos :])
             assert len(blob) == blob_size
             self._blob = blob
             self._pos = 0
@@ -131,47 +502,30 @@ class Blob:
 
     def read_blob(self, n_bytes=None):
         start = self._pos
-        data_structure_code = chr(self.read_value("uint8"))
+        code = self._blob[self._pos]
+        self._pos += 1
         try:
-            call = {
-                # MATLAB-compatible, inherited from original mYm
-                "A": self.read_array,  # matlab-compatible numeric arrays and scalars with ndim==0
-                "P": self.read_sparse_array,  # matlab sparse array -- not supported yet
-                "S": self.read_struct,  # matlab struct array
-                "C": self.read_cell_array,  # matlab cell array
-                # basic data types
-                "\xff": self.read_none,  # None
-                "\x01": self.read_tuple,  # a Sequence (e.g. tuple)
-                "\x02": self.read_list,  # a MutableSequence (e.g. list)
-                "\x03": self.read_set,  # a Set
-                "\x04": self.read_dict,  # a Mapping (e.g. dict)
-                "\x05": self.read_string,  # a UTF8-encoded string
-                "\x06": self.read_bytes,  # a ByteString
-                "\x0a": self.read_int,  # unbounded scalar int
-                "\x0b": self.read_bool,  # scalar boolean
-                "\x0c": self.read_complex,  # scalar 128-bit complex number
-                "\x0d": self.read_float,  # scalar 64-bit float
-                "F": self.read_recarray,  # numpy array with fields, including recarrays
-                "d": self.read_decimal,  # a decimal
-                "t": self.read_datetime,  # date, time, or datetime
-                "u": self.read_uuid,  # UUID
-            }[data_structure_code]
+            read = self._readers[code]
         except KeyError:
             raise DataJointError(
-                'Unknown data structure code "%s". Upgrade datajoint.'
-                % data_structure_code
+                'Unknown data structure code "%s". Upgrade datajoint.' % chr(code)
             )
-        v = call()
+        v = read(self)
         if n_bytes is not None and self._pos - start != n_bytes:
             raise DataJointError("Blob length check failed! Invalid blob")
         return v
 
     def pack_blob(self, obj):
+        """
+        Serialize obj by appending its encoding to the output of pack
+        """
         # original mYm-based serialization from datajoint-matlab
         if isinstance(obj, MatCell):
             return self.pack_cell_array(obj)
         if isinstance(obj, MatStruct):
             return self.pack_struct(obj)
+        if _is_sparse(obj):
+            return self.pack_sparse_array(obj)
         if isinstance(obj, np.ndarray) and obj.dtype.fields is None:
             return self.pack_array(obj)
 
@@ -215,15 +569,83 @@ class Blob:
             return self.pack_set(obj)
         if obj is None:
             return self.pack_none()
+        if config["blob.pickle"]:
+            return self.pack_pickle(obj)
         raise DataJointError(
-            "Packing object of type %s currently not supported!" % type(obj)
+            "Packing object of type %s currently not supported! "
+            'Set dj.config["blob.pickle"] = True to pickle it.' % type(obj)
         )
 
-    def read_array(self):
-        n_dims = int(self.read_value())
+    def read_header(self):
+        """
+        Describe the serialized object from the beginning of its encoding without reading its
+        data. Raises ValueError or struct.error if the buffer ends before the header does.
+
+        :return: dict with the type of the object and, depending on the type, its shape, dtype,
+            length, and field names
+        """
+        code = chr(self.read_scalar(_u8))
+        info = dict(type=structure_names.get(code, "unknown"))
+        if code == "a":
+            info.update(
+                filters=[
+                    array_filter_names[self.read_scalar(_u8)]
+                    for _ in range(self.read_scalar(_u8))
+                ]
+            )
+            code = chr(self.read_scalar(_u8))
+        if code == "s":
+            info.update(format=self.read_zero_terminated_string())
+            code = chr(self.read_scalar(_u8))
+        if code in "ASCP":
+            n_dims = int(self.read_length())
+            shape = np.atleast_1d(self.read_value(count=n_dims))
+            info.update(shape=tuple(int(d) for d in shape))
+        if code in "AP":
+            dtype_id, is_complex = self.read_scalar(_u32x2)
+            scalar_type = deserialize_lookup[dtype_id]["scalar_type"]
+            dtype = deserialize_lookup[dtype_id]["dtype"]
+            if is_complex:
+                dtype = np.dtype(np.complex64 if dtype == np.float32 else np.complex128)
+            info.update(dtype=np.dtype("U") if scalar_type == "CHAR" else dtype)
+        elif code == "c":
+            shape, dtype, rows, offsets, _ = _read_chunk_index(self._blob, self._pos)
+            info.update(shape=shape, dtype=dtype, chunks=len(offsets) - 1)
+        elif code in "SF":
+            n_fields = self.read_scalar(_u32)
+            info.update(
+                fields=[self.read_zero_terminated_string() for _ in range(n_fields)]
+            )
+            if code == "F" and n_fields:
+                info.update(shape=self.read_header().get("shape"))
+        elif code in "\x01\x02\x03\x04\x05\x06":
+            info.update(length=int(self.read_length()))
+        elif code == "\x07":
+            container, element = self.read_scalar(_u8x2)
+            info.update(
+                type=structure_names[chr(container)],
+                length=int(self.read_length()),
+                dtype=compact_sequence_dtypes[element],
+            )
+        return info
+
+    def read_filtered_array(self):
+        """
+        deserialize a numeric array whose data were transformed by pre-filters
+        """
+        filters = [
+            array_filter_names[self.read_scalar(_u8)]
+            for _ in range(self.read_scalar(_u8))
+        ]
+        if chr(self.read_scalar(_u8)) != "A":
+            raise DataJointError("Invalid filtered array in blob")
+        return self.read_array(filters=filters)
+
+    def read_array(self, filters=()):
+        n_dims = int(self.read_length())
         shape = self.read_value(count=n_dims)
         n_elem = np.prod(shape, dtype=int)
-        dtype_id, is_complex = self.read_value("uint32", 2)
+        dtype_id, is_complex = self.read_scalar(_u32x2)
 
         # Get dtype from type id
         dtype = deserialize_lookup[dtype_id]["dtype"]
@@ -231,7 +653,7 @@ class Blob:
         # Check if name is void
         if deserialize_lookup[dtype_id]["scalar_type"] == "VOID":
             data = np.array(
-                list(self.read_blob(self.read_value()) for _ in range(n_elem)),
+                list(self.read_blob(self.read_length()) for _ in range(n_elem)),
                 dtype=np.dtype("O"),
             )
         # Check if name is char
@@ -247,24 +669,37 @@ class Blob:
                     else np.array("".join(data.squeeze()))
                 )
                 shape = (1,)
+        elif filters:
+            n_bytes = n_elem * (2 if is_complex else 1) * dtype.itemsize
+            data = np.frombuffer(self._blob, np.uint8, count=n_bytes, offset=self._pos)
+            self._pos += n_bytes
+            for name in reversed(filters):
+                data = array_filters[name][2](data, dtype)
+            data = data.view(dtype)
+            if is_complex:
+                real, imaginary = data[:n_elem], data[n_elem:]
+                data = np.empty(
+                    n_elem, np.complex64 if dtype == np.float32 else np.complex128
+                )
+                data.real, data.imag = real, imaginary
         else:
             data = self.read_value(dtype, count=n_elem)
             if is_complex:
-                data = data + 1j * self.read_value(dtype, count=n_elem)
+                real = data
+                data = np.empty(
+                    n_elem, np.complex64 if dtype == np.float32 else np.complex128
+                )
+                data.real = real
+                data.imag = self.read_value(dtype, count=n_elem)
         return self.squeeze(data.reshape(shape, order="F"))
 
     def pack_array(self, array):
         """
-        Serialize an np.ndarray into bytes.  Scalars are encoded with ndim=0.
+        Serialize an np.ndarray.  Scalars are encoded with ndim=0.
         """
-        if "datetime64" in array.dtype.name:
+        if array.dtype.kind == "M":  # datetime64
             self.set_dj0()
-        blob = (
-            b"A"
-            + np.uint64(array.ndim).tobytes()
-            + np.array(array.shape, dtype=np.uint64).tobytes()
-        )
-        is_complex = np.iscomplexobj(array)
+        is_complex = array.dtype.kind == "c"
         if is_complex:
             array, imaginary = np.real(array), np.imag(array)
         try:
@@ -275,34 +710,103 @@ class Blob:
                 type_id = serialize_lookup[np.dtype("O")]["type_id"]
             else:
                 raise DataJointError(f"Type {array.dtype} is ambiguous or unknown")
-
-        blob += np.array([type_id, is_complex], dtype=np.uint32).tobytes()
-        if (
-            array.dtype.char == "U"
-            or serialize_lookup[array.dtype]["scalar_type"] == "VOID"
-        ):
-            blob += b"".join(
-                len_u64(it) + it
-                for it in (self.pack_blob(e) for e in array.flatten(order="F"))
+        scalar_type = deserialize_lookup[type_id]["scalar_type"]
+        filters = [
+            name
+            for name in self._filters
+            if scalar_type not in ("VOID", "CHAR")
+            and array.size > 1
+            and array_filters[name][3](array.dtype)
+        ]
+        if filters:
+            self.set_dj0()  # not supported by original mym
+            self._write(
+                b"a",
+                np.array(
+                    [len(filters)] + [array_filters[f][0] for f in filters],
+                    dtype=np.uint8,
+                ).tobytes(),
             )
+        self._write(
+            b"A",
+            np.array((array.ndim,) + array.shape, dtype=np.uint64).tobytes(),
+            np.array([type_id, is_complex], dtype=np.uint32).tobytes(),
+        )
+        if scalar_type == "VOID":
+            for e in array.flatten(order="F"):
+                self._pack_with_length(e)
             self.set_dj0()  # not supported by original mym
-        elif serialize_lookup[array.dtype]["scalar_type"] == "CHAR":
-            blob += (
-                array.view(np.uint8).astype(np.uint16).tobytes()
-            )  # convert to 16-bit chars for MATLAB
+        elif scalar_type == "CHAR":
+            # convert to 16-bit chars for MATLAB
+            self._write(array.view(np.uint8).astype(np.uint16).tobytes())
         else:  # numeric arrays
             if array.ndim == 0:  # not supported by original mym
                 self.set_dj0()
-            blob += array.tobytes(order="F")
-            if is_complex:
-                blob += imaginary.tobytes(order="F")
-        return blob
+            if not filters:
+                self._write_data(array)
+                if is_complex:
+                    self._write_data(imaginary)
+            else:
+                data = np.frombuffer(
+                    array.tobytes(order="F")
+                    + (imaginary.tobytes(order="F") if is_complex else b""),
+                    np.uint8,
+                )
+                for name in filters:
+                    data = array_filters[name][1](data, array.dtype)
+                self._write(memoryview(np.ascontiguousarray(data)))
+
+    def pack_chunked_array(self, array, chunk_size, compress, codec, level):
+        """
+        Serialize a numeric array as independently packed chunks along its leading axis,
+        preceded by an index of the chunks' offsets. Chunked blobs are not compressed as a
+        whole so that individual chunks can be read by offset.
+        """
+        self.set_dj0()
+        rows = max(1, chunk_size // (array.nbytes // len(array) or 1))
+        n_chunks = -(-len(array) // rows)
+        dtype = np.real(array[:0]).dtype
+        try:
+            type_id = serialize_lookup[dtype]["type_id"]
+        except KeyError:
+            raise DataJointError(f"Type {dtype} is ambiguous or unknown")
+        self._write(
+            b"c",
+            np.array((array.ndim,) + array.shape, dtype=np.uint64).tobytes(),
+            np.array([type_id, np.iscomplexobj(array)], dtype=np.uint32).tobytes(),
+            np.array([rows, n_chunks], dtype=np.uint64).tobytes(),
+        )
+        # reserve the index and fill it in once the chunks are written
+        index = len(self._sink)
+        self._sink += bytes(8 * (n_chunks + 1))
+        start = len(self._sink)
+        offsets = [0]
+        for i in range(0, len(array), rows):
+            self._sink += Blob(filters=self._filters).pack(
+                array[i : i + rows], compress=compress, codec=codec, level=level
+            )
+            offsets.append(len(self._sink) - start)
+        self._sink[index:start] = np.array(offsets, dtype=np.uint64).tobytes()
+
+    def read_chunked_array(self):
+        """
+        deserialize a numeric array stored in independently packed chunks
+        """
+        shape, dtype, rows, offsets, self._pos = _read_chunk_index(
+            self._blob, self._pos
+        )
+        data = np.empty(shape, dtype)
+        buffer = memoryview(self._blob)[self._pos :]
+        for i, (start, stop) in enumerate(zip(offsets[:-1], offsets[1:])):
+            data[i * rows : (i + 1) * rows] = unpack(buffer[start:stop])
+        self._pos += int(offsets[-1])
+        return self.squeeze(data)
 
     def read_recarray(self):
         """
         Serialize an np.ndarray with fields, including recarrays
         """
-        n_fields = self.read_value("uint32")
+        n_fields = self.read_scalar(_u32)
         if not n_fields:
             return np.array(None)  # empty array
         field_names = [self.read_zero_terminated_string() for _ in range(n_fields)]
@@ -317,152 +821,295 @@ class Blob:
 
     def pack_recarray(self, array):
         """Serialize a Matlab struct array"""
-        return (
-            b"F"
-            + len_u32(array.dtype)
-            + "\0".join(array.dtype.names).encode()  # number of fields
-            + b"\0"
-            + b"".join(  # field names
-                (
-                    self.pack_recarray(array[f])
-                    if array[f].dtype.fields
-                    else self.pack_array(array[f])
-                )
-                for f in array.dtype.names
-            )
+        self._write(
+            b"F",
+            len_u32(array.dtype),  # number of fields
+            "\0".join(array.dtype.names).encode(),  # field names
+            b"\0",
         )
+        for f in array.dtype.names:
+            if array[f].dtype.fields:
+                self.pack_recarray(array[f])
+            else:
+                self.pack_array(array[f])
 
     def read_sparse_array(self):
-        raise DataJointError(
-            "datajoint-python does not yet support sparse arrays. Issue (#590)"
+        """
+        deserialize a 2-D sparse matrix in MATLAB's compressed sparse column layout as a
+        scipy.sparse.csc_matrix
+        """
+        sparse = _import_sparse()
+        n_dims = self.read_length()
+        shape = tuple(int(d) for d in np.atleast_1d(self.read_value(count=n_dims)))
+        dtype_id, is_complex = self.read_scalar(_u32x2)
+        n_nonzero = int(self.read_length())
+        dtype = deserialize_lookup[dtype_id]["dtype"]
+        if n_dims != 2 or dtype is None:
+            raise DataJointError("Invalid sparse array in blob")
+        indices = np.atleast_1d(self.read_value(count=n_nonzero)).astype(np.int64)
+        indptr = np.atleast_1d(self.read_value(count=shape[1] + 1)).astype(np.int64)
+        data = np.atleast_1d(self.read_value(dtype, count=n_nonzero))
+        if is_complex:
+            real = data
+            data = np.empty(
+                n_nonzero, np.complex64 if dtype == np.float32 else np.complex128
+            )
+            data.real = real
+            data.imag = np.atleast_1d(self.read_value(dtype, count=n_nonzero))
+        return sparse.csc_matrix((data, indices, indptr), shape=shape)
+
+    def pack_sparse_array(self, matrix):
+        """
+        Serialize a 2-D scipy.sparse matrix or array in MATLAB's compressed sparse column
+        layout: the row indices of the nonzero elements, the column pointers, and the
+        nonzero values. Other classes than csc_matrix are tagged with their class name and
+        unpacked as the same class.
+        """
+        name = type(matrix).__name__
+        csc = matrix.tocsc()
+        if not csc.has_sorted_indices:
+            csc = csc.sorted_indices()
+        is_complex = csc.dtype.kind == "c"
+        data = csc.data[: csc.nnz]
+        if is_complex:
+            data, imaginary = np.real(data), np.imag(data)
+        try:
+            type_id = serialize_lookup[data.dtype]["type_id"]
+        except KeyError:
+            raise DataJointError(f"Sparse arrays of type {csc.dtype} are not supported")
+        if name != "csc_matrix":
+            self.set_dj0()  # not supported by original mym
+            self._write(b"s", name.encode(), b"\0")
+        elif data.dtype not in (np.float64, np.bool_):
+            self.set_dj0()  # MATLAB sparse matrices are double or logical
+        self._write(
+            b"P",
+            np.array((2,) + csc.shape, dtype=np.uint64).tobytes(),
+            np.array([type_id, is_complex], dtype=np.uint32).tobytes(),
+            np.uint64(csc.nnz).tobytes(),
         )
+        self._write_data(csc.indices[: csc.nnz].astype(np.uint64))
+        self._write_data(csc.indptr.astype(np.uint64))
+        self._write_data(data)
+        if is_complex:
+            self._write_data(imaginary)
+
+    def read_sparse_format(self):
+        """
+        deserialize a sparse matrix or array tagged with its scipy.sparse class name
+        """
+        name = self.read_zero_terminated_string()
+        cls = getattr(_import_sparse(), name, None)
+        if not isinstance(cls, type) or self.read_scalar(_u8) != ord("P"):
+            raise DataJointError(f"Invalid sparse array {name} in blob")
+        return cls(self.read_sparse_array())
+
+    def read_pickle(self):
+        """
+        deserialize a pickled object whose out-of-band buffers follow the pickle
+        """
+        if not config["blob.pickle"]:
+            raise DataJointError(
+                "The blob contains a pickled object. Unpickling can execute arbitrary code: "
+                'set dj.config["blob.pickle"] = True to unpack blobs from trusted sources.'
+            )
+        n_buffers = self.read_length()
+        data = self.read_segment()
+        buffers = []
+        for _ in range(n_buffers):
+            compressed = self.read_scalar(_u8)
+            segment = self.read_segment()
+            if compressed:
+                prefix = next(p for p in compression if segment[: len(p)] == p)
+                size = _u64.unpack_from(segment, len(prefix))[0]
+                segment = compression[prefix](segment[len(prefix) + 8 :])
+                if len(segment) != size:
+                    raise DataJointError("Blob length check failed! Invalid blob")
+            buffers.append(segment)
+        return pickle.loads(data, buffers=buffers)
+
+    def pack_pickle(self, obj):
+        """
+        Serialize an object with pickle protocol 5. Contiguous buffers such as the data of
+        numpy arrays are written out of band after the pickle as raw segments, each
+        compressed separately when the blob is compressed.
+        """
+        buffers = []
+        data = pickle.dumps(obj, protocol=5, buffer_callback=buffers.append)
+        self._write(b"p", len_u64(buffers), len_u64(data), data)
+        compress, codec, level = self._compression
+        if compress and buffers:
+            prefix, compressor, level = _resolve_codec(codec, level)
+        for buffer in buffers:
+            raw = buffer.raw()
+            segment = (
+                prefix + len_u64(raw) + compressor(raw, level)
+                if compress and raw.nbytes > 1000
+                else None
+            )
+            if segment is None or len(segment) >= raw.nbytes:
+                self._write(b"\0", len_u64(raw), raw)
+            else:
+                self._write(b"\1", len_u64(segment), segment)
+        self._segments = self._segments or bool(buffers)
+
+    def read_segment(self):
+        """
+        :return: a memoryview of the bytes that follow their uint64 length, without copying them
+        """
+        size = self.read_length()
+        self._pos += size
+        return memoryview(self._blob)[self._pos - size : self._pos]
 
     def read_int(self):
         return int.from_bytes(
-            self.read_binary(self.read_value("uint16")), byteorder="little", signed=True
+            self.read_binary(self.read_scalar(_u16)), byteorder="little", signed=True
         )
 
-    @staticmethod
-    def pack_int(v):
+    def pack_int(self, v):
         n_bytes = v.bit_length() // 8 + 1
         assert 0 < n_bytes <= 0xFFFF, "Integers are limited to 65535 bytes"
-        return (
-            b"\x0a"
-            + np.uint16(n_bytes).tobytes()
-            + v.to_bytes(n_bytes, byteorder="little", signed=True)
+        self._write(
+            b"\x0a",
+            np.uint16(n_bytes).tobytes(),
+            v.to_bytes(n_bytes, byteorder="little", signed=True),
         )
 
     def read_bool(self):
-        return bool(self.read_value("bool"))
+        return self.read_scalar(_bool)
 
-    @staticmethod
-    def pack_bool(v):
-        return b"\x0b" + np.array(v, dtype="bool").tobytes()
+    def pack_bool(self, v):
+        self._write(b"\x0b", np.array(v, dtype="bool").tobytes())
 
     def read_complex(self):
-        return complex(self.read_value("complex128"))
+        return complex(*self.read_scalar(_f64x2))
 
-    @staticmethod
-    def pack_complex(v):
-        return b"\x0c" + np.array(v, dtype="complex128").tobytes()
+    def pack_complex(self, v):
+        self._write(b"\x0c", np.array(v, dtype="complex128").tobytes())
 
     def read_float(self):
-        return float(self.read_value("float64"))
+        return self.read_scalar(_f64)
 
-    @staticmethod
-    def pack_float(v):
-        return b"\x0d" + np.array(v, dtype="float64").tobytes()
+    def pack_float(self, v):
+        self._write(b"\x0d", np.array(v, dtype="float64").tobytes())
 
     def read_decimal(self):
         return Decimal(self.read_string())
 
-    @staticmethod
-    def pack_decimal(d):
+    def pack_decimal(self, d):
         s = str(d)
-        return b"d" + len_u64(s) + s.encode()
+        self._write(b"d", len_u64(s), s.encode())
 
     def read_string(self):
-        return self.read_binary(self.read_value()).decode()
+        return self.read_binary(self.read_length()).decode()
 
-    @staticmethod
-    def pack_string(s):
+    def pack_string(self, s):
         blob = s.encode()
-        return b"\5" + len_u64(blob) + blob
+        self._write(b"\5", len_u64(blob), blob)
 
     def read_bytes(self):
-        return self.read_binary(self.read_value())
+        return self.read_binary(self.read_length())
 
-    @staticmethod
-    def pack_bytes(s):
-        return b"\6" + len_u64(s) + s
+    def pack_bytes(self, s):
+        self._write(b"\6", len_u64(s), s)
 
     def read_none(self):
         pass
 
-    @staticmethod
-    def pack_none():
-        return b"\xff"
+    def pack_none(self):
+        self._write(b"\xff")
 
     def read_tuple(self):
-        return tuple(
-            self.read_blob(self.read_value()) for _ in range(self.read_value())
-        )
+        return tuple(self.read_list())
 
     def pack_tuple(self, t):
-        return (
-            b"\1"
-            + len_u64(t)
-            + b"".join(len_u64(it) + it for it in (self.pack_blob(i) for i in t))
-        )
+        if self._compact_sequences and self.pack_compact_sequence(b"\1", t):
+            return
+        self._write(b"\1", len_u64(t))
+        for item in t:
+            self._pack_with_length(item)
 
     def read_list(self):
-        return list(self.read_blob(self.read_value()) for _ in range(self.read_value()))
+        read_blob, read_length = self.read_blob, self.read_length
+        return [read_blob(read_length()) for _ in range(read_length())]
 
     def pack_list(self, t):
-        return (
-            b"\2"
-            + len_u64(t)
-            + b"".join(len_u64(it) + it for it in (self.pack_blob(i) for i in t))
-        )
+        if self._compact_sequences and self.pack_compact_sequence(b"\2", t):
+            return
+        self._write(b"\2", len_u64(t))
+        for item in t:
+            self._pack_with_length(item)
+
+    def read_compact_sequence(self):
+        """
+        deserialize a list or tuple of python ints, floats, or bools stored as a typed array
+        """
+        container, element = self.read_scalar(_u8x2)
+        n_elem = self.read_length()
+        try:
+            dtype = compact_sequence_dtypes[element]
+        except KeyError:
+            raise DataJointError("Invalid compact sequence in blob") from None
+        data = np.frombuffer(self._blob, dtype, count=n_elem, offset=self._pos)
+        self._pos += data.nbytes
+        if container == 2:
+            return data.tolist()
+        if container == 1:
+            return tuple(data.tolist())
+        raise DataJointError("Invalid compact sequence in blob")
+
+    def pack_compact_sequence(self, code, t):
+        """
+        Serialize a non-empty sequence whose elements are all python ints, all floats, or all
+        bools as a typed array tagged with the code of its container (tuple or list).
+
+        :return: False if the sequence does not qualify and nothing was written
+        """
+        types = set(map(type, t))
+        if len(types) != 1:
+            return False
+        try:
+            element, dtype = compact_sequence_types[types.pop()]
+            data = np.array(t, dtype=dtype)
+        except (KeyError, OverflowError):  # other types or ints beyond 64 bits
+            return False
+        self._write(b"\x07", code, element, len_u64(t))
+        self._write_data(data)
+        return True
 
     def read_set(self):
-        return set(self.read_blob(self.read_value()) for _ in range(self.read_value()))
+        return set(self.read_list())
 
     def pack_set(self, t):
-        return (
-            b"\3"
-            + len_u64(t)
-            + b"".join(len_u64(it) + it for it in (self.pack_blob(i) for i in t))
-        )
+        self._write(b"\3", len_u64(t))
+        for item in t:
+            self._pack_with_length(item)
 
     def read_dict(self):
+        read_blob, read_length = self.read_blob, self.read_length
         return dict(
-            (self.read_blob(self.read_value()), self.read_blob(self.read_value()))
-            for _ in range(self.read_value())
+            (read_blob(read_length()), read_blob(read_length()))
+            for _ in range(read_length())
         )
 
     def pack_dict(self, d):
-        return (
-            b"\4"
-            + len_u64(d)
-            + b"".join(
-                b"".join((len_u64(it) + it) for it in packed)
-                for packed in (map(self.pack_blob, pair) for pair in d.items())
-            )
-        )
+        self._write(b"\4", len_u64(d))
+        for key, value in d.items():
+            self._pack_with_length(key)
+            self._pack_with_length(value)
 
     def read_struct(self):
         """deserialize matlab struct"""
-        n_dims = self.read_value()
+        n_dims = self.read_length()
         shape = self.read_value(count=n_dims)
         n_elem = np.prod(shape, dtype=int)
-        n_fields = self.read_value("uint32")
+        n_fields = self.read_scalar(_u32)
         if not n_fields:
             return np.array(None)  # empty array
         field_names = [self.read_zero_terminated_string() for _ in range(n_fields)]
         raw_data = [
             tuple(
-                self.read_blob(n_bytes=int(self.read_value())) for _ in range(n_fields)
+                self.read_blob(n_bytes=int(self.read_length())) for _ in range(n_fields)
             )
             for __ in range(n_elem)
         ]
@@ -473,26 +1120,23 @@ class Blob:
 
     def pack_struct(self, array):
         """Serialize a Matlab struct array"""
-        return (
-            b"S"
-            + np.array((array.ndim,) + array.shape, dtype=np.uint64).tobytes()
-            + len_u32(array.dtype.names)  # dimensionality
-            + "\0".join(array.dtype.names).encode()  # number of fields
-            + b"\0"
-            + b"".join(  # field names
-                len_u64(it) + it
-                for it in (
-                    self.pack_blob(e) for rec in array.flatten(order="F") for e in rec
-                )
-            )
-        )  # values
+        self._write(
+            b"S",
+            np.array((array.ndim,) + array.shape, dtype=np.uint64).tobytes(),
+            len_u32(array.dtype.names),  # number of fields
+            "\0".join(array.dtype.names).encode(),  # field names
+            b"\0",
+        )
+        for rec in array.flatten(order="F"):
+            for e in rec:
+                self._pack_with_length(e)  # values
 
     def read_cell_array(self):
         """deserialize MATLAB cell array"""
-        n_dims = self.read_value()
+        n_dims = self.read_length()
         shape = self.read_value(count=n_dims)
         n_elem = int(np.prod(shape))
-        result = [self.read_blob(n_bytes=self.read_value()) for _ in range(n_elem)]
+        result = [self.read_blob(n_bytes=self.read_length()) for _ in range(n_elem)]
         return (
             self.squeeze(
                 np.array(result).reshape(shape, order="F"), convert_to_scalar=False
@@ -500,18 +1144,15 @@ class Blob:
         ).view(MatCell)
 
     def pack_cell_array(self, array):
-        return (
-            b"C"
-            + np.array((array.ndim,) + array.shape, dtype=np.uint64).tobytes()
-            + b"".join(
-                len_u64(it) + it
-                for it in (self.pack_blob(e) for e in array.flatten(order="F"))
-            )
+        self._write(
+            b"C", np.array((array.ndim,) + array.shape, dtype=np.uint64).tobytes()
         )
+        for e in array.flatten(order="F"):
+            self._pack_with_length(e)
 
     def read_datetime(self):
         """deserialize datetime.date, .time, or .datetime"""
-        date, time = self.read_value("int32"), self.read_value("int64")
+        date, time = self.read_scalar(_i32), self.read_scalar(_i64)
         date = (
             datetime.date(year=date // 10000, month=(date // 100) % 100, day=date % 100)
             if date >= 0
@@ -529,40 +1170,63 @@ class Blob:
         )
         return time and date and datetime.datetime.combine(date, time) or time or date
 
-    @staticmethod
-    def pack_datetime(d):
+    def pack_datetime(self, d):
         if isinstance(d, datetime.datetime):
             date, time = d.date(), d.time()
         elif isinstance(d, datetime.date):
             date, time = d, None
         else:
             date, time = None, d
-        return b"t" + (
+        self._write(
+            b"t",
             np.int32(
                 -1 if date is None else (date.year * 100 + date.month) * 100 + date.day
-            ).tobytes()
-            + np.int64(
+            ).tobytes(),
+            np.int64(
                 -1
                 if time is None
                 else ((time.hour * 100 + time.minute) * 100 + time.second) * 1000000
                 + time.microsecond
-            ).tobytes()
+            ).tobytes(),
         )
 
     def read_uuid(self):
         q = self.read_binary(16)
         return uuid.UUID(bytes=q)
 
-    @staticmethod
-    def pack_uuid(obj):
-        return b"u" + obj.bytes
+    def pack_uuid(self, obj):
+        self._write(b"u", obj.bytes)
+
+    def _startswith(self, prefix):
+        if isinstance(self._blob, memoryview):
+            return self._blob[self._pos : self._pos + len(prefix)] == prefix
+        return self._blob.startswith(prefix, self._pos)
 
     def read_zero_terminated_string(self):
-        target = self._blob.find(b"\0", self._pos)
-        data = self._blob[self._pos : target].decode()
+        if isinstance(self._blob, memoryview):
+            target = self._pos
+            while self._blob[target] != 0:
+                target += 1
+        else:
+            target = self._blob.find(b"\0", self._pos)
+        data = bytes(self._blob[self._pos : target]).decode()
         self._pos = target + 1
         return data
 
+    def read_scalar(self, fmt):
+        """
+        read a header field without allocating an array
+
+        :param fmt: a struct.Struct; values of formats with several fields are returned as a tuple
+        """
+        values = fmt.unpack_from(self._blob, self._pos)
+        self._pos += fmt.size
+        return values if len(values) > 1 else values[0]
+
+    def read_length(self):
+        """read a length or dimension in the configured width"""
+        return self.read_scalar(_u32 if use_32bit_dims else _u64)
+
     def read_value(self, dtype=None, count=1):
         if dtype is None:
             dtype = "uint32" if use_32bit_dims else "uint64"
@@ -572,37 +1236,427 @@ class Blob:
 
     def read_binary(self, size):
         self._pos += int(size)
-        return self._blob[self._pos - int(size) : self._pos]
+        return bytes(self._blob[self._pos - int(size) : self._pos])
+
+    @staticmethod
+    def _is_chunked(obj, chunk_size):
+        return bool(
+            chunk_size
+            and isinstance(obj, np.ndarray)
+            and not isinstance(obj, (MatCell, MatStruct))
+            and obj.dtype.kind in "biufcM"
+            and obj.ndim
+            and obj.nbytes > chunk_size
+        )
+
+    def _pack_uncompressed(self, obj, compress, codec, level, chunk_size):
+        """
+        append the protocol and the encoding of obj to the sink
 
-    def pack(self, obj, compress):
+        :return: True if the blob is to be compressed as a whole
+        """
         self.protocol = b"mYm\0"  # will be replaced with dj0 if new features are used
-        blob = self.pack_blob(
-            obj
-        )  # this may reset the protocol and must precede protocol evaluation
-        blob = self.protocol + blob
+        self._sink += self.protocol
+        self._compression = (compress, codec, level)
+        self._compact_sequences = config["blob.compact_sequences"]
+        self._segments = self._is_chunked(obj, chunk_size)
+        if self._segments:
+            # chunks are compressed individually
+            self.pack_chunked_array(obj, chunk_size, compress, codec, level)
+        else:
+            self.pack_blob(obj)
+        # packing may reset the protocol, which is therefore written last
+        self._sink[: len(self.protocol)] = self.protocol
+        return compress and not self._segments
+
+    def pack(self, obj, compress, codec=None, level=None, chunk_size=None):
+        self._sink = bytearray()
+        compress = self._pack_uncompressed(obj, compress, codec, level, chunk_size)
+        blob, self._sink = self._sink, None
         if compress and len(blob) > 1000:
-            compressed = b"ZL123\0" + len_u64(blob) + zlib.compress(blob)
+            prefix, compressor, level = _resolve_codec(codec, level)
+            compressed = prefix + len_u64(blob) + compressor(blob, level)
             if len(compressed) < len(blob):
-                blob = compressed
-        return blob
+                return compressed
+        return bytes(blob)
 
+    def pack_to(self, fileobj, obj, compress, codec=None, level=None, chunk_size=None):
+        """
+        Serialize obj into a seekable binary file.
+        Blobs to be compressed are first written uncompressed to a temporary file and then
+        compressed in chunks.
 
-def pack(obj, compress=True):
+        :return: the number of bytes written
+        """
+        if not compress or self._is_chunked(obj, chunk_size):
+            self._sink = _FileSink(fileobj)
+            self._pack_uncompressed(obj, compress, codec, level, chunk_size)
+            size, self._sink = len(self._sink), None
+            return size
+        start = fileobj.tell()
+        with tempfile.SpooledTemporaryFile(max_size=spool_size) as raw:
+            self._sink = _FileSink(raw)
+            compress = self._pack_uncompressed(obj, compress, codec, level, chunk_size)
+            size, self._sink = len(self._sink), None
+            raw.seek(0)
+            if compress and size > 1000:
+                prefix, compressor, level = _resolve_codec(codec, level)
+                compress_stream = stream_compression.get(prefix)
+                pieces = (
+                    compress_stream(iter(lambda: raw.read(1 << 20), b""), level, size)
+                    if compress_stream
+                    else [compressor(raw.read(), level)]
+                )
+                fileobj.write(prefix + np.uint64(size).tobytes())
+                written = len(prefix) + 8
+                for piece in pieces:
+                    fileobj.write(piece)
+                    written += len(piece)
+                    if written >= size:
+                        break
+                else:
+                    return written
+                # the compressed blob is not smaller: store it uncompressed instead
+                fileobj.seek(start)
+                fileobj.truncate()
+                raw.seek(0)
+            shutil.copyfileobj(raw, fileobj, 1 << 20)
+        return size
+
+    # readers of the data structure codes, dispatched by read_blob
+    _readers = {
+        ord(code): read
+        for code, read in (
+            # MATLAB-compatible, inherited from original mYm
+            (
+                "A",
+                read_array,
+            ),  # matlab-compatible numeric arrays and scalars with ndim==0
+            ("P", read_sparse_array),  # matlab sparse array
+            ("S", read_struct),  # matlab struct array
+            ("C", read_cell_array),  # matlab cell array
+            # basic data types
+            ("\xff", read_none),  # None
+            ("\x01", read_tuple),  # a Sequence (e.g. tuple)
+            ("\x02", read_list),  # a MutableSequence (e.g. list)
+            ("\x03", read_set),  # a Set
+            ("\x04", read_dict),  # a Mapping (e.g. dict)
+            ("\x05", read_string),  # a UTF8-encoded string
+            ("\x06", read_bytes),  # a ByteString
+            ("\x07", read_compact_sequence),  # a list or tuple of same-type scalars
+            ("\x0a", read_int),  # unbounded scalar int
+            ("\x0b", read_bool),  # scalar boolean
+            ("\x0c", read_complex),  # scalar 128-bit complex number
+            ("\x0d", read_float),  # scalar 64-bit float
+            ("F", read_recarray),  # numpy array with fields, including recarrays
+            ("d", read_decimal),  # a decimal
+            ("t", read_datetime),  # date, time, or datetime
+            ("u", read_uuid),  # UUID
+            ("a", read_filtered_array),  # numeric array with pre-filters
+            ("c", read_chunked_array),  # numeric array in independent chunks
+            ("s", read_sparse_format),  # scipy.sparse class of a sparse array
+            ("p", read_pickle),  # pickle protocol 5 with out-of-band buffers (opt-in)
+        )
+    }
+
+
+def _read_chunk_index(buffer, pos):
+    """
+    Parse the header of a chunked array that follows its data structure code.
+
+    :param buffer: bytes-like object containing the header
+    :param pos: position of the header in buffer
+    :return: (shape, dtype, rows per chunk, chunk offsets, position of the first chunk)
+    """
+    n_dims = int(np.frombuffer(buffer, np.uint64, count=1, offset=pos)[0])
+    pos += 8
+    shape = tuple(
+        int(d) for d in np.frombuffer(buffer, np.uint64, count=n_dims, offset=pos)
+    )
+    pos += 8 * n_dims
+    type_id, is_complex = np.frombuffer(buffer, np.uint32, count=2, offset=pos)
+    pos += 8
+    rows, n_chunks = (
+        int(v) for v in np.frombuffer(buffer, np.uint64, count=2, offset=pos)
+    )
+    pos += 16
+    offsets = np.frombuffer(buffer, np.uint64, count=n_chunks + 1, offset=pos).astype(
+        np.int64
+    )
+    pos += 8 * (n_chunks + 1)
+    dtype = deserialize_lookup[type_id]["dtype"]
+    if is_complex:
+        dtype = np.dtype(np.complex64 if dtype == np.float32 else np.complex128)
+    return shape, dtype, rows, offsets, pos
+
+
+def unpack_slice(read, index, squeeze=False):
+    """
+    Unpack a slice along the leading axis of an array blob, reading only the chunks that
+    contain it when the blob was packed with chunk_size. Other blobs are read in full.
+
+    :param read: function(offset, size) returning the bytes of the blob in the given range,
+        or the entire blob when size is None. It returns None if the blob is null.
+    :param index: an integer, a slice, or a tuple of indices whose first element is an
+        integer or a slice
+    :param squeeze: if True, remove extra dimensions from the result
+    :return: the indexed array
+    """
+    index = index if isinstance(index, tuple) else (index,)
+    head = read(0, 4096)
+    if head is None:
+        return None
+    if not head.startswith(b"dj0\0c") or not isinstance(index[0], (int, slice)):
+        return Blob(squeeze=squeeze).squeeze(unpack(read(0, None))[index])
+    try:
+        shape, dtype, rows, offsets, start = _read_chunk_index(head, 5)
+    except ValueError:  # the header exceeds the initial read
+        n_dims = int(np.frombuffer(head, np.uint64, count=1, offset=5)[0])
+        n_chunks = int(
+            np.frombuffer(head, np.uint64, count=1, offset=29 + 8 * n_dims)[0]
+        )
+        head = read(0, 37 + 8 * (n_dims + n_chunks + 1))
+        shape, dtype, rows, offsets, start = _read_chunk_index(head, 5)
+
+    # the selected elements along the leading axis
+    if isinstance(index[0], slice):
+        selected = range(*index[0].indices(shape[0]))
+    else:
+        i = index[0] + shape[0] if index[0] < 0 else index[0]
+        if not 0 <= i < shape[0]:
+            raise IndexError(
+                "index {} is out of bounds for axis 0 with size {}".format(
+                    index[0], shape[0]
+                )
+            )
+        selected = range(i, i + 1)
+    if not selected:
+        data = np.empty((0,) + shape[1:], dtype)[(slice(None),) + index[1:]]
+        return Blob(squeeze=squeeze).squeeze(data)
+
+    # read and unpack only the chunks that contain the selected elements
+    first = min(selected[0], selected[-1]) // rows
+    last = max(selected[0], selected[-1]) // rows
+    buffer = memoryview(
+        read(start + int(offsets[first]), int(offsets[last + 1] - offsets[first]))
+    )
+    data = np.concatenate(
+        [
+            unpack(buffer[a - offsets[first] : b - offsets[first]])
+            for a, b in zip(offsets[first : last + 1], offsets[first + 1 : last + 2])
+        ]
+    )
+    base = first * rows
+    if isinstance(index[0], slice):
+        stop = selected[-1] - base + (1 if selected.step > 0 else -1)
+        local = slice(selected[0] - base, None if stop < 0 else stop, selected.step)
+    else:
+        local = selected[0] - base
+    return Blob(squeeze=squeeze).squeeze(data[(local,) + index[1:]])
+
+
+def pack(obj, compress=True, codec=None, level=None, filters=None, chunk_size=None):
+    """
+    Serialize an object into a blob.
+
+    :param obj: the object to serialize
+    :param compress: if True, compress blobs larger than 1000 bytes
+    :param codec: name of the compression codec. Default from dj.config["blob.codec"]
+    :param level: compression level of the codec. Default from dj.config["blob.compression_level"]
+        when the codec is not specified, otherwise the codec's default
+    :param filters: names of lossless pre-filters ("shuffle", "bitshuffle", "delta") applied in
+        order to the data of numeric arrays. Default from dj.config["blob.filters"]. Filters
+        that do not apply to an array's dtype are skipped.
+    :param chunk_size: if set, numeric arrays larger than chunk_size bytes are packed as
+        independently compressed chunks of about chunk_size bytes along their leading axis so
+        that slices can be read without unpacking the entire array. Default from
+        dj.config["blob.chunk_size"]
+    :return: the serialized bytes
+    """
     if bypass_serialization:
         # provide a way to move blobs quickly without de/serialization
         assert isinstance(obj, bytes) and obj.startswith(
-            (b"ZL123\0", b"mYm\0", b"dj0\0")
+            (*compression, b"mYm\0", b"dj0\0")
         )
         return obj
-    return Blob().pack(obj, compress=compress)
+    return Blob(filters=_filter_names(filters)).pack(
+        obj,
+        compress=compress,
+        codec=codec,
+        level=level,
+        chunk_size=config["blob.chunk_size"] if chunk_size is None else chunk_size,
+    )
+
+
+def pack_to(
+    fileobj, obj, compress=True, codec=None, level=None, filters=None, chunk_size=None
+):
+    """
+    Serialize an object into a binary file with bounded memory use. The data of large arrays
+    are written and compressed in chunks so that the serialized blob is never held in memory.
+    Except for the framing of some codecs, such as lz4, the bytes written are the same as
+    those returned by pack.
+
+    :param fileobj: a seekable binary file open for writing, positioned where the blob starts
+    :param obj: the object to serialize
+    :param compress, codec, level, filters, chunk_size: see pack
+    :return: the number of bytes written
+    """
+    if bypass_serialization:
+        fileobj.write(pack(obj))
+        return len(obj)
+    return Blob(filters=_filter_names(filters)).pack_to(
+        fileobj,
+        obj,
+        compress=compress,
+        codec=codec,
+        level=level,
+        chunk_size=config["blob.chunk_size"] if chunk_size is None else chunk_size,
+    )
+
+
+def _filter_names(filters):
+    """
+    :return: tuple of the names of the pre-filters, by default from dj.config
+    """
+    filters = tuple(config["blob.filters"] if filters is None else filters)
+    try:
+        unknown = next(f for f in filters if f not in array_filters)
+    except StopIteration:
+        return filters
+    raise DataJointError(
+        'Unknown blob filter "{filter}". Use one of {names}'.format(
+            filter=unknown, names=", ".join(array_filters)
+        )
+    )
 
 
 def unpack(blob, squeeze=False):
     if bypass_serialization:
         # provide a way to move blobs quickly without de/serialization
         assert isinstance(blob, bytes) and blob.startswith(
-            (b"ZL123\0", b"mYm\0", b"dj0\0")
+            (*compression, b"mYm\0", b"dj0\0")
         )
         return blob
     if blob is not None:
+        if isinstance(blob, memoryview):
+            blob = blob.cast("B")
         return Blob(squeeze=squeeze).unpack(blob)
+
+
+def _remaining_size(fileobj):
+    """
+    :return: the number of bytes from the position of a regular file to its end, or None if
+        fileobj is not a seekable regular file, e.g. a socket or a pipe
+    """
+    try:
+        if not fileobj.seekable():
+            return None
+        status = os.fstat(fileobj.fileno())
+    except (AttributeError, OSError, ValueError):
+        return None
+    if not stat.S_ISREG(status.st_mode):
+        return None
+    return status.st_size - fileobj.tell()
+
+
+def unpack_from(fileobj, squeeze=False):
+    """
+    Deserialize a blob read from a binary file. Compressed blobs are decompressed in chunks
+    into a single buffer without holding the compressed data in memory, and uncompressed
+    numeric arrays are returned as views into that buffer.
+
+    :param fileobj: a binary file object positioned at the beginning of a blob that extends to
+        its end, e.g. an open file or a streamed download
+    :param squeeze: if True, remove extra dimensions from arrays
+    :return: the unpacked object
+    """
+    if bypass_serialization:
+        return unpack(fileobj.read())
+    head = fileobj.read(max(len(p) for p in compression) + 8)
+    prefix = next((p for p in compression if head.startswith(p)), None)
+    if prefix is None:
+        remaining = _remaining_size(fileobj)
+        if remaining is None:
+            # e.g. a streamed download: the size is unknown
+            return unpack(head + fileobj.read(), squeeze=squeeze)
+        size = len(head) + remaining
+        buffer = bytearray(size)
+        buffer[: len(head)] = head
+        view, pos = memoryview(buffer), len(head)
+        while pos < size:
+            n = fileobj.readinto(view[pos:])
+            if not n:
+                break
+            pos += n
+        return Blob(squeeze=squeeze).unpack(view[:pos])
+    size = int(np.frombuffer(head, np.uint64, count=1, offset=len(prefix))[0])
+    chunks = chain([head[len(prefix) + 8 :]], iter(lambda: fileobj.read(1 << 20), b""))
+    decompress_stream = stream_decompression.get(prefix)
+    if decompress_stream is None:
+        buffer = compression[prefix](b"".join(chunks))
+        pos = len(buffer)
+    else:
+        buffer, pos = bytearray(size), 0
+        for piece in decompress_stream(chunks):
+            if pos + len(piece) > size:
+                break
+            buffer[pos : pos + len(piece)] = piece
+            pos += len(piece)
+    if pos != size:
+        raise DataJointError("Blob length check failed! Invalid blob")
+    return Blob(squeeze=squeeze).unpack(buffer)
+
+
+def inspect(blob, stored_size=None):
+    """
+    Describe a blob without unpacking it. Only the header is parsed and, for compressed blobs
+    whose codec supports it, only the beginning of the payload is decompressed.
+
+    :param blob: the serialized bytes or their beginning
+    :param stored_size: the stored size of the blob if blob contains only its beginning
+    :return: dict with the keys "protocol" ("mYm" or "dj0"), "codec" (None if uncompressed),
+        "stored_size", "size" (uncompressed), "type", and depending on the type "shape",
+        "dtype", "length", "fields", "filters", and "chunks"
+    """
+    if blob is None:
+        return None
+    if isinstance(blob, memoryview):
+        blob = blob.cast("B")
+    info = dict(stored_size=len(blob) if stored_size is None else stored_size)
+    prefix = next(
+        (p for p in compression if bytes(blob[: len(p)]) == p),
+        None,
+    )
+    if prefix is None:
+        info.update(codec=None, size=info["stored_size"])
+
+        def head(size):
+            return blob[:size]
+
+    else:
+        info.update(
+            codec=next((k for k, v in codecs.items() if v[0] == prefix), None),
+            size=int(np.frombuffer(blob, np.uint64, count=1, offset=len(prefix))[0]),
+        )
+        payload = memoryview(blob)[len(prefix) + 8 :]
+        partial = partial_decompression.get(prefix)
+        head = (
+            (lambda size: partial(payload, size))
+            if partial
+            else (lambda size: compression[prefix](payload))
+        )
+    size = 1024
+    while True:
+        data = head(size)
+        reader = Blob()
+        reader._blob = data
+        try:
+            info.update(protocol=reader.read_zero_terminated_string())
+            info.update(reader.read_header())
+        except (ValueError, IndexError, struct.error):
+            if len(data) < size:
+                raise DataJointError("Incomplete or invalid blob header") from None
+            size *= 16
+        else:
+            return info
@@ -3,9 +3,11 @@ This module contains the Connection class that manages the connection to the dat
 the ``conn`` function that provides access to a persistent connection in datajoint.
 """
 
+import itertools
 import logging
 import pathlib
 import re
+import threading
 import warnings
 from contextlib import contextmanager
 from getpass import getpass
@@ -127,6 +129,12 @@ class EmulatedCursor:
     def fetchone(self):
         return next(self._iter)
 
+    def fetchmany(self, size):
+        return list(itertools.islice(self._iter, size))
+
+    def close(self):
+        pass
+
     @property
     def rowcount(self):
         return len(self._data)
@@ -162,6 +170,7 @@ class Connection:
         self.conn_info["ssl_input"] = use_tls
         self.init_fun = init_fun
         self._conn = None
+        self._lock = threading.RLock()
         self._query_cache = None
         self.connect()
         if self.is_connected:
@@ -221,6 +230,8 @@ class Connection:
                     },
                 )
         self._conn.autocommit(True)
+        self._max_allowed_packet = None
+        self._unbuffered_cursor = None
 
     def set_query_cache(self, query_cache=None):
         """
@@ -275,7 +286,14 @@ class Connection:
             raise translate_query_error(err, query)
 
     def query(
-        self, query, args=(), *, as_dict=False, suppress_warnings=True, reconnect=None
+        self,
+        query,
+        args=(),
+        *,
+        as_dict=False,
+        suppress_warnings=True,
+        reconnect=None,
+        unbuffered=False,
     ):
         """
         Execute the specified query and return the tuple generator (cursor).
@@ -286,6 +304,9 @@ class Connection:
                         query results as dictionary.
         :param suppress_warnings: If True, suppress all warnings arising from underlying query library
         :param reconnect: when None, get from config, when True, attempt to reconnect if disconnected
+        :param unbuffered: If True, use a server-side cursor that streams rows from the server
+                        instead of loading the entire result into client memory. Other queries raise
+                        a DataJointError until the cursor is exhausted or closed.
         """
         # check cache first:
         use_query_cache = bool(self._query_cache)
@@ -313,23 +334,40 @@ class Connection:
         if reconnect is None:
             reconnect = config["database.reconnect"]
         logger.debug("Executing SQL:" + query[:query_log_max_length])
-        cursor_class = client.cursors.DictCursor if as_dict else client.cursors.Cursor
-        cursor = self._conn.cursor(cursor=cursor_class)
-        try:
-            self._execute_query(cursor, query, args, suppress_warnings)
-        except errors.LostConnectionError:
-            if not reconnect:
-                raise
-            logger.warning("Reconnecting to MySQL server.")
-            self.connect()
-            if self._in_transaction:
-                self.cancel_transaction()
-                raise errors.LostConnectionError(
-                    "Connection was lost during a transaction."
+        if unbuffered:
+            cursor_class = (
+                client.cursors.SSDictCursor if as_dict else client.cursors.SSCursor
+            )
+        else:
+            cursor_class = (
+                client.cursors.DictCursor if as_dict else client.cursors.Cursor
+            )
+        # queries may be issued from worker threads, e.g. while decoding blobs
+        with self._lock:
+            if self.in_unbuffered_query:
+                # the client would silently discard the rest of the unbuffered result
+                raise errors.DataJointError(
+                    "Cannot execute a query while an unbuffered query result is being read. "
+                    "Exhaust or close the stream before issuing other queries."
                 )
-            logger.debug("Re-executing")
             cursor = self._conn.cursor(cursor=cursor_class)
-            self._execute_query(cursor, query, args, suppress_warnings)
+            try:
+                self._execute_query(cursor, query, args, suppress_warnings)
+            except errors.LostConnectionError:
+                if not reconnect:
+                    raise
+                logger.warning("Reconnecting to MySQL server.")
+                self.connect()
+                if self._in_transaction:
+                    self.cancel_transaction()
+                    raise errors.LostConnectionError(
+                        "Connection was lost during a transaction."
+                    )
+                logger.debug("Re-executing")
+                cursor = self._conn.cursor(cursor=cursor_class)
+                self._execute_query(cursor, query, args, suppress_warnings)
+            if unbuffered:
+                self._unbuffered_cursor = cursor
 
         if use_query_cache:
             data = cursor.fetchall()
@@ -338,12 +376,47 @@ class Connection:
 
         return cursor
 
+    @property
+    def in_unbuffered_query(self):
+        """
+        :return: True if the result of an unbuffered query has not been fully read or closed.
+        """
+        cursor = self._unbuffered_cursor
+        if cursor is not None:
+            result = cursor._result
+            if (
+                cursor.connection is not None
+                and result is not None
+                and result.unbuffered_active
+            ):
+                return True
+            self._unbuffered_cursor = None
+        return False
+
     def get_user(self):
         """
         :return: the user name and host name provided by the client to the server.
         """
         return self.query("SELECT user()").fetchone()[0]
 
+    @property
+    def max_allowed_packet(self):
+        """
+        :return: the largest statement in bytes that the server accepts from this session.
+        """
+        if self._max_allowed_packet is None:
+            self._max_allowed_packet = int(
+                self.query("SELECT @@max_allowed_packet").fetchone()[0]
+            )
+        return self._max_allowed_packet
+
+    def escape(self, value):
+        """
+        :param value: a value to be included in a query
+        :return: the quoted and escaped SQL literal of value
+        """
+        return self._conn.escape(value)
+
     # ---------- transaction processing
     @property
     def in_transaction(self):
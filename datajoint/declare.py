@@ -10,6 +10,7 @@ from hashlib import sha1
 import pyparsing as pp
 
 from .attribute_adapter import get_adapter
+from .blob import codecs
 from .condition import translate_attribute
 from .errors import FILEPATH_FEATURE_SWITCH, DataJointError, _support_filepath_types
 from .settings import config
@@ -67,6 +68,9 @@ SERIALIZED_TYPES = {
 
 assert set().union(SPECIAL_TYPES, EXTERNAL_TYPES, SERIALIZED_TYPES) <= set(TYPE_PATTERN)
 
+# compression codec of a blob attribute specified at the start of its comment, e.g. [codec=zstd:3]
+CODEC_PATTERN = re.compile(r"\[codec=(?P<codec>[\w\-]+)(:(?P<level>-?\d+))?\]", re.I)
+
 
 def match_type(attribute_type):
     try:
@@ -568,6 +572,21 @@ def compile_attribute(line, in_key, foreign_key_sql, context):
         )
 
     category = match_type(match["type"])
+    codec = CODEC_PATTERN.match(match["comment"])
+    if codec:
+        if category not in ("INTERNAL_BLOB", "EXTERNAL_BLOB", "ADAPTED"):
+            raise DataJointError(
+                "A compression codec can only be specified for blobs in:\n{line}".format(
+                    line=line
+                )
+            )
+        if codec["codec"] not in codecs:
+            raise DataJointError(
+                'Unknown blob codec "{codec}" in:\n{line}'.format(
+                    codec=codec["codec"], line=line
+                )
+            )
+
     if category in SPECIAL_TYPES:
         match["comment"] = ":{type}:{comment}".format(
             **match
@@ -544,6 +544,18 @@ class QueryExpression:
     def fetch(self):
         return Fetch(self)
 
+    def iter_batches(self, *attrs, batch_size=None, **fetch_kwargs):
+        """
+        Iterate over the query result in batches fetched through an unbuffered cursor.
+        Equivalent to fetch(*attrs, stream=True, batch_size=batch_size, ...)
+
+        :param attrs: zero or more attributes to fetch, as in fetch
+        :param batch_size: number of entries per batch. Default from config["fetch.batch_size"]
+        :param fetch_kwargs: kwargs for fetch
+        :return: generator of batches, each in the format that fetch would return
+        """
+        return self.fetch(*attrs, stream=True, batch_size=batch_size, **fetch_kwargs)
+
     def head(self, limit=25, **fetch_kwargs):
         """
         shortcut to fetch the first few entries from query expression.
@@ -649,14 +661,15 @@ class QueryExpression:
                     # -- move on to next entry.
                     return next(self)
 
-    def cursor(self, as_dict=False):
+    def cursor(self, as_dict=False, unbuffered=False):
         """
         See expression.fetch() for input description.
+        :param unbuffered: if True, stream the result through a server-side cursor
         :return: query cursor
         """
         sql = self.make_sql()
         logger.debug(sql)
-        return self.connection.query(sql, as_dict=as_dict)
+        return self.connection.query(sql, as_dict=as_dict, unbuffered=unbuffered)
 
     def __repr__(self):
         """
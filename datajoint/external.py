@@ -1,5 +1,6 @@
 import logging
 from collections.abc import Mapping
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path, PurePosixPath, PureWindowsPath
 
 from tqdm import tqdm
@@ -7,7 +8,7 @@ from tqdm import tqdm
 from . import errors, s3
 from .declare import EXTERNAL_TABLE_ROOT
 from .errors import DataJointError, MissingExternalFile
-from .hash import uuid_from_buffer, uuid_from_file
+from .hash import uuid_from_buffer, uuid_from_file, uuid_from_stream
 from .heading import Heading
 from .settings import config
 from .table import FreeTable, Table
@@ -54,6 +55,7 @@ class ExternalTable(Table):
             )
         )
         self._support = [self.full_table_name]
+        self._stored = set()  # hashes of objects known to be tracked and stored
         if not self.is_declared:
             self.declare()
         self._s3 = None
@@ -139,6 +141,26 @@ class ExternalTable(Table):
         else:
             assert False
 
+    def _upload_stream(self, stream, size, external_path):
+        if self.spec["protocol"] == "s3":
+            self.s3.put_stream(external_path, stream, size)
+        elif self.spec["protocol"] == "file":
+            safe_write(external_path, stream)
+        else:
+            assert False
+
+    def _open_buffer(self, external_path):
+        if self.spec["protocol"] == "s3":
+            return self.s3.open(external_path)
+        if self.spec["protocol"] == "file":
+            try:
+                return Path(external_path).open("rb")
+            except FileNotFoundError:
+                raise errors.MissingExternalFile(
+                    f"Missing external file {external_path}"
+                ) from None
+        assert False
+
     def _download_buffer(self, external_path):
         if self.spec["protocol"] == "s3":
             return self.s3.get(external_path)
@@ -151,6 +173,20 @@ class ExternalTable(Table):
                 ) from None
         assert False
 
+    def _download_buffer_range(self, external_path, offset, size):
+        if self.spec["protocol"] == "s3":
+            return self.s3.get_range(external_path, offset, size)
+        if self.spec["protocol"] == "file":
+            try:
+                with Path(external_path).open("rb") as f:
+                    f.seek(offset)
+                    return f.read(size)
+            except FileNotFoundError:
+                raise errors.MissingExternalFile(
+                    f"Missing external file {external_path}"
+                ) from None
+        assert False
+
     def _remove_external_file(self, external_path):
         if self.spec["protocol"] == "s3":
             self.s3.remove_object(external_path)
@@ -177,16 +213,148 @@ class ExternalTable(Table):
         put a binary string (blob) in external store
         """
         uuid = uuid_from_buffer(blob)
-        self._upload_buffer(blob, self._make_uuid_path(uuid))
-        # insert tracking info
+        external_path = self._make_uuid_path(uuid)
+        if uuid not in self._lookup_stored({uuid: external_path}):
+            self._upload_buffer(blob, external_path)
+            self._remember(uuid)
+        self._insert_blob_tracking(uuid, len(blob))
+        return uuid
+
+    def put_stream(self, stream, staged=None):
+        """
+        put the contents of a seekable binary file, e.g. written by blob.pack_to, in external
+        store. The contents are hashed and uploaded in chunks without reading them into memory.
+
+        :param stream: seekable binary file
+        :param staged: optional list-like object. If given, the upload is deferred: an
+            (external table, tracking entry, external path, stream) tuple is appended to it
+            to be uploaded later by upload_staged, and the stream must remain open until then.
+        """
+        stream.seek(0)
+        uuid = uuid_from_stream(stream)
+        size = stream.tell()
+        stream.seek(0)
+        self._stage(
+            dict(hash=uuid, size=size), self._make_uuid_path(uuid), stream, staged
+        )
+        return uuid
+
+    def _stage(self, entry, external_path, source, staged):
+        if staged is None:
+            self.upload_staged([(entry, external_path, source)])
+        else:
+            staged.append((self, entry, external_path, source))
+
+    def upload_staged(self, staged, workers=1, tracked=None):
+        """
+        upload objects to external store and record them in the tracking table. Objects
+        that are already stored are looked up with one query and not uploaded again, and
+        the others are uploaded concurrently. If an upload fails, the objects that were
+        uploaded are still tracked.
+
+        :param staged: list of (tracking entry, external path, source) of objects in this
+            store. The source is the path of a local file or a seekable binary file.
+        :param workers: the number of concurrent uploads
+        :param tracked: optional list to which the (external table, tracking entry) pairs
+            of the tracked objects are appended
+        """
+        stored = self._lookup_stored(
+            {entry["hash"]: path for entry, path, _ in staged}, workers
+        )
+        uploads = {}  # objects staged more than once are uploaded once
+        for item in staged:
+            if item[0]["hash"] not in stored:
+                uploads.setdefault(item[0]["hash"], item)
+
+        def upload(item):
+            entry, external_path, source = item
+            if isinstance(source, Path):
+                self._upload_file(source, external_path)
+            else:
+                source.seek(0)
+                self._upload_stream(source, entry["size"], external_path)
+            stored.add(entry["hash"])
+            self._remember(entry["hash"])
+
+        try:
+            if workers > 1 and len(uploads) > 1:
+                with ThreadPoolExecutor(max_workers=workers) as executor:
+                    list(executor.map(upload, uploads.values()))
+            else:
+                for item in uploads.values():
+                    upload(item)
+        finally:
+            entries = [entry for entry, _, _ in staged if entry["hash"] in stored]
+            if tracked is not None:
+                tracked.extend((self, entry) for entry in entries)
+            self.insert_tracking(entries)
+
+    def _lookup_stored(self, paths, workers=1):
+        """
+        look up which objects need not be uploaded because they are tracked, with one
+        query, and present in the store. The store is checked for the tracked objects
+        concurrently, unless dj.config["external.verify_existing"] is False.
+        See dj.config["external.skip_existing"].
+
+        :param paths: dict of the external paths of objects keyed by hash
+        :param workers: the number of concurrent checks of the store
+        :return: set of the hashes of the objects that are already stored
+        """
+        if not config["external.skip_existing"]:
+            return set()
+        known = {uuid for uuid in paths if uuid in self._stored}
+        tracked = list(self.fetch_tracking(paths.keys() - known))
+        if config["external.verify_existing"]:
+            tracked_paths = [paths[uuid] for uuid in tracked]
+            if workers > 1 and len(tracked) > 1:
+                with ThreadPoolExecutor(max_workers=workers) as executor:
+                    exists = list(executor.map(self.exists, tracked_paths))
+            else:
+                exists = list(map(self.exists, tracked_paths))
+            tracked = [uuid for uuid, e in zip(tracked, exists) if e]
+        for uuid in tracked:
+            self._remember(uuid)
+        return known.union(tracked)
+
+    def _remember(self, uuid):
+        """
+        cache the hash of a stored object in memory, up to
+        dj.config["external.hash_cache_size"] hashes
+        """
+        limit = config["external.hash_cache_size"]
+        if limit:
+            if len(self._stored) >= limit:
+                self._stored.clear()
+            self._stored.add(uuid)
+
+    def _insert_blob_tracking(self, uuid, size):
+        self.insert_tracking([dict(hash=uuid, size=size)])
+
+    def insert_tracking(self, entries):
+        """
+        record uploaded objects in the tracking table with a single query
+
+        :param entries: dicts with the hash, size, and optional attachment_name of each object.
+            Entries that are already tracked have their timestamp updated.
+        """
+        if not entries:
+            return
         self.connection.query(
-            "INSERT INTO {tab} (hash, size) VALUES (%s, {size}) ON DUPLICATE KEY "
-            "UPDATE timestamp=CURRENT_TIMESTAMP".format(
-                tab=self.full_table_name, size=len(blob)
+            "INSERT INTO {tab} (hash, size, attachment_name) VALUES {values} "
+            "ON DUPLICATE KEY UPDATE timestamp=CURRENT_TIMESTAMP".format(
+                tab=self.full_table_name,
+                values=",".join(["(%s, %s, %s)"] * len(entries)),
             ),
-            args=(uuid.bytes,),
+            args=[
+                value
+                for entry in entries
+                for value in (
+                    entry["hash"].bytes,
+                    entry["size"],
+                    entry.get("attachment_name"),
+                )
+            ],
         )
-        return uuid
 
     def get(self, uuid):
         """
@@ -225,24 +393,98 @@ class ExternalTable(Table):
                 safe_write(cache_path / uuid.hex, blob)
         return blob
 
+    def open(self, uuid):
+        """
+        open an object in external store for reading without downloading it into memory.
+        If a cache folder is configured, the object is first downloaded into the cache.
+
+        :param uuid: the hash of the object
+        :return: a binary file object. The caller must close it.
+        """
+        cache_folder = config.get("cache", None)
+        if cache_folder:
+            cache_file = Path(
+                cache_folder, *subfold(uuid.hex, CACHE_SUBFOLDING), uuid.hex
+            )
+            if not cache_file.is_file():
+                with self._open_object(uuid) as stream:
+                    safe_write(cache_file, stream)
+            return cache_file.open("rb")
+        return self._open_object(uuid)
+
+    def _open_object(self, uuid):
+        """
+        :return: a binary file object streaming an object from external store, bypassing the
+            cache
+        """
+        try:
+            return self._open_buffer(self._make_uuid_path(uuid))
+        except MissingExternalFile:
+            if not SUPPORT_MIGRATED_BLOBS:
+                raise
+            # blobs migrated from datajoint 0.11 are stored at explicitly defined filepaths
+            relative_filepath = (self & {"hash": uuid}).fetch1("filepath")
+            if relative_filepath is None:
+                raise
+            return self._open_buffer(self._make_external_filepath(relative_filepath))
+
+    def get_range(self, uuid, offset, size):
+        """
+        get a byte range of an object from external store without downloading the rest,
+        e.g. the chunks of a chunked blob.
+
+        :param uuid: the hash of the object
+        :param offset: the position of the first byte
+        :param size: the number of bytes. If None, the entire object is returned
+        """
+        if size is None:
+            return self.get(uuid)
+        cache_folder = config.get("cache", None)
+        if cache_folder:
+            cache_file = Path(
+                cache_folder, *subfold(uuid.hex, CACHE_SUBFOLDING), uuid.hex
+            )
+            if cache_file.is_file():
+                with cache_file.open("rb") as f:
+                    f.seek(offset)
+                    return f.read(size)
+        return self._download_buffer_range(self._make_uuid_path(uuid), offset, size)
+
+    def fetch_tracking(self, uuids, *attributes):
+        """
+        fetch tracking information for multiple objects in one query.
+
+        :param uuids: iterable of object hashes (UUID)
+        :param attributes: attributes of the external table to fetch
+        :return: dict of dicts of the requested attributes keyed by hash
+        """
+        restriction = [{"hash": uuid} for uuid in dict.fromkeys(uuids)]
+        if not restriction:
+            return {}
+        return {
+            row.pop("hash"): row
+            for row in (self & restriction).fetch("hash", *attributes, as_dict=True)
+        }
+
     # --- ATTACHMENTS ---
 
-    def upload_attachment(self, local_path):
-        attachment_name = Path(local_path).name
+    def upload_attachment(self, local_path, staged=None):
+        """
+        :param local_path: path of the file to attach
+        :param staged: optional list to which the upload is appended, see put_stream
+        """
+        local_path = Path(local_path)
+        attachment_name = local_path.name
         uuid = uuid_from_file(local_path, init_string=attachment_name + "\0")
-        external_path = self._make_uuid_path(uuid, "." + attachment_name)
-        self._upload_file(local_path, external_path)
-        # insert tracking info
-        self.connection.query(
-            """
-        INSERT INTO {tab} (hash, size, attachment_name)
-        VALUES (%s, {size}, "{attachment_name}")
-        ON DUPLICATE KEY UPDATE timestamp=CURRENT_TIMESTAMP""".format(
-                tab=self.full_table_name,
-                size=Path(local_path).stat().st_size,
+        self._stage(
+            dict(
+                hash=uuid,
+                size=local_path.stat().st_size,
                 attachment_name=attachment_name,
             ),
-            args=[uuid.bytes],
+            self._make_uuid_path(uuid, "." + attachment_name),
+            local_path,
+            staged,
         )
         return uuid
 
@@ -303,11 +545,13 @@ class ExternalTable(Table):
             )
         return uuid
 
-    def download_filepath(self, filepath_hash):
+    def download_filepath(self, filepath_hash, tracking=None):
         """
         sync a file from external store to the local stage
 
         :param filepath_hash: The hash (UUID) of the relative_path
+        :param tracking: optional dict with the filepath, contents_hash, and size of the
+            file as returned by fetch_tracking, to avoid querying the external table
         :return: hash (UUID) of the contents of the downloaded file or Nones
         """
 
@@ -322,9 +566,11 @@ class ExternalTable(Table):
             return limit is None or actual_size < limit
 
         if filepath_hash is not None:
+            if tracking is None:
+                tracking = (self & {"hash": filepath_hash}).fetch1()
             relative_filepath, contents_hash, size = (
-                self & {"hash": filepath_hash}
-            ).fetch1("filepath", "contents_hash", "size")
+                tracking[k] for k in ("filepath", "contents_hash", "size")
+            )
             external_path = self._make_external_filepath(relative_filepath)
             local_filepath = Path(self.spec["stage"]).absolute() / relative_filepath
 
@@ -441,6 +687,7 @@ class ExternalTable(Table):
                 "True or False in delete()"
             )
 
+        self._stored.clear()  # deleted objects may have been cached as stored
         if not delete_external_files:
             self.unused().delete_quick()
         else:
@@ -1,8 +1,13 @@
+import collections
+import copy
 import itertools
 import json
 import numbers
 import uuid
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from functools import partial
+from operator import itemgetter
 from pathlib import Path
 
 import numpy as np
@@ -11,10 +16,13 @@ import pandas
 from datajoint.condition import Top
 
 from . import blob, hash
+from .declare import TYPE_PATTERN
 from .errors import DataJointError
 from .settings import config
 from .utils import safe_write
 
+fetch_formats = ("array", "frame", "arrow", "polars")
+
 
 class key:
     """
@@ -35,7 +43,7 @@ def to_dicts(recarray):
         yield dict(zip(recarray.dtype.names, rec.tolist()))
 
 
-def _get(connection, attr, data, squeeze, download_path):
+def _get(connection, attr, data, squeeze, download_path, prefetched=None):
     """
     This function is called for every attribute
 
@@ -44,6 +52,8 @@ def _get(connection, attr, data, squeeze, download_path):
     :param data: literal value fetched from the table
     :param squeeze: if True squeeze blobs
     :param download_path: for fetches that download data, e.g. attachments
+    :param prefetched: for external attributes, dict keyed by uuid with the unpacked
+        blobs, the attachment names, or the tracking info of filepaths
     :return: unpacked data
     """
     if data is None:
@@ -60,8 +70,11 @@ def _get(connection, attr, data, squeeze, download_path):
     # apply attribute adapter if present
     adapt = attr.adapter.get if attr.adapter else lambda x: x
 
+    prefetched = prefetched or {}
+
     if attr.is_filepath:
-        return adapt(extern.download_filepath(uuid.UUID(bytes=data))[0])
+        _uuid = uuid.UUID(bytes=data)
+        return adapt(extern.download_filepath(_uuid, tracking=prefetched.get(_uuid))[0])
     if attr.is_attachment:
         # Steps:
         # 1. get the attachment filename
@@ -70,7 +83,7 @@ def _get(connection, attr, data, squeeze, download_path):
         # 4. Otherwise, download the remote file and return the new filepath
         _uuid = uuid.UUID(bytes=data) if attr.is_external else None
         attachment_name = (
-            extern.get_attachment_name(_uuid)
+            (prefetched.get(_uuid) or extern.get_attachment_name(_uuid))
             if attr.is_external
             else data.split(b"\0", 1)[0].decode()
         )
@@ -105,18 +118,432 @@ def _get(connection, attr, data, squeeze, download_path):
             safe_write(local_filepath, data.split(b"\0", 1)[1])
         return adapt(str(local_filepath))  # download file from remote store
 
+    if attr.is_blob and attr.is_external:
+        _uuid = uuid.UUID(bytes=data)
+        return adapt(
+            prefetched[_uuid]
+            if _uuid in prefetched
+            else _unpack_external(extern, _uuid, squeeze)
+        )
+
     return adapt(
         uuid.UUID(bytes=data)
         if attr.uuid
-        else (
-            blob.unpack(
-                extern.get(uuid.UUID(bytes=data)) if attr.is_external else data,
-                squeeze=squeeze,
+        else (blob.unpack(data, squeeze=squeeze) if attr.is_blob else data)
+    )
+
+
+def _unpack_external(extern, _uuid, squeeze):
+    """stream an external blob from the store or the cache into unpack"""
+    with extern.open(_uuid) as f:
+        return blob.unpack_from(f, squeeze=squeeze)
+
+
+def _is_decoded(attr):
+    """
+    :return: True if values of the attribute must pass through _get, False if the values
+        fetched from the cursor are returned as is (numeric, string, and temporal types)
+    """
+    return bool(
+        attr.is_blob
+        or attr.is_attachment
+        or attr.is_filepath
+        or attr.json
+        or attr.uuid
+        or attr.adapter
+    )
+
+
+class LazyBlob:
+    """
+    Proxy for a fetched blob that is unpacked upon first access.
+    It keeps the raw value fetched from the table, i.e. the serialized blob or the hash of an
+    externally stored blob. Use load() to obtain the unpacked value explicitly. Attribute access,
+    indexing, iteration, and conversion to numpy arrays are forwarded to the unpacked value.
+
+    :param get: function that unpacks the raw value
+    :param data: the raw value fetched from the table
+    """
+
+    __slots__ = ("_get", "_data", "_value")
+    _unloaded = object()
+
+    def __init__(self, get, data):
+        self._get = get
+        self._data = data
+        self._value = self._unloaded
+
+    @property
+    def loaded(self):
+        """:return: True if the blob has been unpacked"""
+        return self._value is not self._unloaded
+
+    def load(self):
+        """
+        :return: the unpacked blob, which is retained for subsequent calls
+        """
+        if not self.loaded:
+            self._value = self._get(self._data)
+            self._get = self._data = None
+        return self._value
+
+    def __getattr__(self, name):
+        return getattr(self.load(), name)
+
+    def __getitem__(self, item):
+        return self.load()[item]
+
+    def __len__(self):
+        return len(self.load())
+
+    def __iter__(self):
+        return iter(self.load())
+
+    def __eq__(self, other):
+        if isinstance(other, LazyBlob):
+            other = other.load()
+        return self.load() == other
+
+    __hash__ = None
+
+    def __array__(self, dtype=None, copy=None):
+        return np.asarray(self.load(), dtype=dtype)
+
+    def __repr__(self):
+        return (
+            "LazyBlob({!r})".format(self._value)
+            if self.loaded
+            else "LazyBlob(<not loaded>)"
+        )
+
+
+class _Decoder:
+    """
+    Decodes fetched values one attribute at a time.
+    External objects referenced by an attribute are resolved with one query per store and
+    downloaded concurrently. External blobs are unpacked by the downloading threads as they
+    are streamed from the store, and other blobs are optionally decoded on a thread pool.
+    Use as a context manager to control the lifetime of the thread pool.
+
+    :param connection: a dj.Connection object
+    :param squeeze: if True squeeze blobs
+    :param download_path: for fetches that download data, e.g. attachments
+    :param decode_workers: the number of threads decoding blobs stored in the table
+    :param download_workers: the number of threads downloading external objects
+    :param lazy_blobs: if True, blobs are returned as LazyBlob proxies
+    :param blob_info: if True, blobs are described by blob.inspect instead of being unpacked
+    """
+
+    def __init__(
+        self,
+        connection,
+        squeeze,
+        download_path,
+        decode_workers,
+        download_workers,
+        lazy_blobs=False,
+        blob_info=False,
+    ):
+        self.connection = connection
+        self.squeeze = squeeze
+        self.get = partial(
+            _get, connection, squeeze=squeeze, download_path=download_path
+        )
+        self.decode_workers = decode_workers
+        self.download_workers = download_workers
+        self.lazy_blobs = lazy_blobs
+        self.blob_info = blob_info
+        self._executor = None
+
+    def __enter__(self):
+        if self.decode_workers > 1:
+            self._executor = ThreadPoolExecutor(max_workers=self.decode_workers)
+        return self
+
+    def __exit__(self, *exc_info):
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+
+    def _map(self, get, values):
+        return (self._executor.map if self._executor else map)(get, values)
+
+    def __call__(self, attr, values):
+        """
+        :param attr: attribute from the query's heading
+        :param values: iterable of values fetched from the cursor
+        :return: iterator of decoded values in the original order
+        """
+        if self.blob_info and attr.is_blob:
+            return self._inspect(attr, values)
+        if self.lazy_blobs and attr.is_blob:
+            get = partial(self.get, attr)
+            return (None if v is None else LazyBlob(get, v) for v in values)
+        if not attr.is_external:
+            get = partial(self.get, attr)
+            return self._map(get, values) if attr.is_blob else map(get, values)
+        values = list(values)
+        extern = self.connection.schemas[attr.database].external[attr.store]
+        unique = list(dict.fromkeys(v for v in values if v is not None))
+        hashes = [uuid.UUID(bytes=v) for v in unique]
+        if attr.is_blob:
+            # external blobs are streamed into unpack as they are downloaded
+            unpack = partial(_unpack_external, extern, squeeze=self.squeeze)
+            if self.download_workers > 1 and len(hashes) > 1:
+                with ThreadPoolExecutor(max_workers=self.download_workers) as executor:
+                    prefetched = dict(zip(hashes, executor.map(unpack, hashes)))
+            else:
+                prefetched = {_uuid: unpack(_uuid) for _uuid in hashes}
+            get = partial(self.get, attr)
+            returned = set()
+
+            def get_copy(data):
+                # rows that share a hash receive their own copies of the unpacked blob
+                if data is None or data not in returned:
+                    returned.add(data)
+                    return get(data, prefetched=prefetched)
+                _uuid = uuid.UUID(bytes=data)
+                return get(data, prefetched={_uuid: copy.deepcopy(prefetched[_uuid])})
+
+            return map(get_copy, values)
+        if attr.is_attachment:
+            prefetched = {
+                k: v["attachment_name"]
+                for k, v in extern.fetch_tracking(hashes, "attachment_name").items()
+            }
+            # attachments with the same name are resolved by the same thread to avoid
+            # collisions between alias filenames
+            groups = defaultdict(list)
+            for data, _uuid in zip(unique, hashes):
+                groups[prefetched.get(_uuid)].append(data)
+            groups = list(groups.values())
+        else:
+            prefetched = extern.fetch_tracking(
+                hashes, "filepath", "contents_hash", "size"
+            )
+            groups = [[data] for data in unique]
+
+        get = partial(self.get, attr, prefetched=prefetched)
+
+        def resolve(group):
+            return [(data, get(data)) for data in group]
+
+        if self.download_workers > 1 and len(groups) > 1:
+            with ThreadPoolExecutor(max_workers=self.download_workers) as executor:
+                resolved = dict(
+                    itertools.chain.from_iterable(executor.map(resolve, groups))
+                )
+        else:
+            resolved = dict(itertools.chain.from_iterable(map(resolve, groups)))
+        return (None if v is None else resolved[v] for v in values)
+
+    def _inspect(self, attr, values):
+        if not attr.is_external:
+            return map(blob.inspect, values)
+        # read only the beginning of external blobs and their stored size from the tracking table
+        values = list(values)
+        extern = self.connection.schemas[attr.database].external[attr.store]
+        hashes = list(
+            dict.fromkeys(uuid.UUID(bytes=v) for v in values if v is not None)
+        )
+        sizes = extern.fetch_tracking(hashes, "size")
+
+        def inspect(_uuid):
+            try:
+                return blob.inspect(
+                    extern.get_range(_uuid, 0, 1 << 16),
+                    stored_size=sizes[_uuid]["size"],
+                )
+            except DataJointError:  # the header exceeds the range
+                return blob.inspect(extern.get(_uuid))
+
+        if self.download_workers > 1 and len(hashes) > 1:
+            with ThreadPoolExecutor(max_workers=self.download_workers) as executor:
+                info = dict(zip(hashes, executor.map(inspect, hashes)))
+        else:
+            info = {h: inspect(h) for h in hashes}
+        return (None if v is None else info[uuid.UUID(bytes=v)] for v in values)
+
+
+def _make_columns(rows, heading, record_type, decode):
+    """
+    Fill one numpy array per attribute directly from the fetched rows.
+    Attributes that need no decoding are copied into arrays of their native dtype
+    without calling _get for every value.
+
+    :param rows: a sequence of tuples fetched from a cursor
+    :param heading: the heading of the query expression
+    :param record_type: the numpy dtype of the result
+    :param decode: a _Decoder for the attributes that need decoding
+    :return: dict of numpy arrays keyed by attribute name
+    """
+    n = len(rows)
+    columns = {}
+    for i, (name, attr) in enumerate(heading.attributes.items()):
+        values = map(itemgetter(i), rows)
+        dtype = record_type[name]
+        if _is_decoded(attr):
+            column = np.empty(n, dtype=dtype)
+            for j, value in enumerate(decode(attr, values)):
+                column[j] = value
+        elif dtype.hasobject:
+            column = np.empty(n, dtype=dtype)
+            column[:] = list(values)
+        else:
+            column = np.fromiter(values, dtype=dtype, count=n)
+        columns[name] = column
+    return columns
+
+
+def _blob_to_arrow(pa, values):
+    """
+    Convert decoded blob values into an arrow array.
+    Numeric arrays of the same dtype become a list column or, if all shapes are equal, a
+    fixed-size list column of the flattened arrays.
+
+    :param pa: the pyarrow module
+    :param values: list of decoded blob values
+    :return: arrow array and the field metadata
+    """
+    arrays = [v for v in values if v is not None]
+    if (
+        arrays
+        and all(isinstance(v, np.ndarray) and v.dtype.kind in "biuf" for v in arrays)
+        and len({v.dtype for v in arrays}) == 1
+    ):
+        dtype = arrays[0].dtype
+        is_null = np.fromiter(
+            (v is None for v in values), dtype=bool, count=len(values)
+        )
+        mask = pa.array(is_null) if is_null.any() else None
+        shapes = {v.shape for v in arrays}
+        if len(shapes) == 1:
+            shape = shapes.pop()
+            size = int(np.prod(shape))
+            flat = np.concatenate(
+                [np.zeros(size, dtype) if v is None else v.ravel() for v in values]
+            )
+            return pa.FixedSizeListArray.from_arrays(pa.array(flat), size, mask=mask), {
+                "shape": json.dumps(shape)
+            }
+        offsets = np.zeros(len(values) + 1, dtype=np.int64)
+        np.cumsum([0 if v is None else v.size for v in values], out=offsets[1:])
+        list_array = pa.ListArray if offsets[-1] < 2**31 else pa.LargeListArray
+        return (
+            list_array.from_arrays(
+                pa.array(offsets, pa.int32() if list_array is pa.ListArray else None),
+                pa.array(np.concatenate([v.ravel() for v in arrays])),
+                mask=mask,
+            ),
+            None,
+        )
+    try:
+        return pa.array(values), None
+    except (pa.ArrowInvalid, pa.ArrowTypeError, pa.ArrowNotImplementedError):
+        raise DataJointError(
+            "Blob values of this attribute cannot be represented in arrow. "
+            'Fetch them with format="array" or "frame" instead.'
+        )
+
+
+def _make_arrow_table(rows, heading, decode):
+    """
+    Build a pyarrow.Table with one arrow array per attribute directly from the fetched rows.
+
+    :param rows: a sequence of tuples fetched from a cursor
+    :param heading: the heading of the query expression
+    :param decode: a _Decoder for the attributes that need decoding
+    :return: pyarrow.Table
+    """
+    try:
+        import pyarrow as pa
+    except ImportError:
+        raise DataJointError(
+            'pyarrow must be installed to fetch with format="arrow" or "polars".'
+        ) from None
+
+    n = len(rows)
+    fields, arrays = [], []
+    for i, (name, attr) in enumerate(heading.attributes.items()):
+        values = map(itemgetter(i), rows)
+        metadata = None
+        dtype = np.dtype(attr.dtype)
+        if attr.uuid and not attr.adapter:
+            array = pa.array(list(values), type=pa.binary(16))
+        elif attr.json and not attr.adapter:
+            array = pa.array(list(values), type=pa.string())
+        elif attr.is_blob:
+            array, metadata = _blob_to_arrow(pa, list(decode(attr, values)))
+        elif _is_decoded(attr):
+            array = pa.array(list(decode(attr, values)))
+        elif not dtype.hasobject:
+            # nulls were converted to nan, mark them as nulls
+            array = pa.array(
+                np.fromiter(values, dtype=dtype, count=n), from_pandas=True
             )
-            if attr.is_blob
-            else data
+        else:
+            array = pa.array(list(values))
+            if TYPE_PATTERN["ENUM"].match(attr.type):
+                array = array.dictionary_encode()
+        fields.append(pa.field(name, array.type, metadata=metadata))
+        arrays.append(array)
+    return pa.Table.from_arrays(arrays, schema=pa.schema(fields))
+
+
+def _make_result(rows, heading, decode, as_dict, format):
+    """
+    Unpack a collection of rows fetched from a cursor
+
+    :param rows: a sequence of tuples or, if as_dict, a sequence of dicts
+    :param heading: the heading of the query expression
+    :param decode: a _Decoder that unpacks the values of one attribute
+    :param as_dict: if True, return a list of dicts
+    :param format: "array", "frame", "arrow", or "polars"
+    :return: a structured numpy.array, a pandas.DataFrame, a pyarrow.Table,
+        a polars.DataFrame, or a list of dicts
+    """
+    if not isinstance(rows, collections.abc.Sequence):
+        rows = list(rows)
+    if as_dict:
+        columns = [
+            decode(heading[name], map(itemgetter(name), rows)) for name in heading.names
+        ]
+        return [dict(zip(heading.names, values)) for values in zip(*columns)]
+    if format in ("arrow", "polars"):
+        table = _make_arrow_table(rows, heading, decode)
+        if format == "arrow":
+            return table
+        try:
+            import polars
+        except ImportError:
+            raise DataJointError(
+                'polars must be installed to fetch with format="polars".'
+            ) from None
+        return polars.from_arrow(table)
+    record_type = (
+        heading.as_dtype
+        if not rows
+        else np.dtype(
+            [
+                (
+                    (
+                        name,
+                        type(value),
+                    )  # use the first element to determine blob type
+                    if heading[name].is_blob and isinstance(value, numbers.Number)
+                    else (name, heading.as_dtype[name])
+                )
+                for value, name in zip(rows[0], heading.as_dtype.names)
+            ]
         )
     )
+    columns = _make_columns(rows, heading, record_type, decode)
+    if format == "frame":
+        return pandas.DataFrame(columns, copy=False).set_index(heading.primary_key)
+    ret = np.empty(len(rows), dtype=record_type)
+    for name, column in columns.items():
+        ret[name] = column
+    return ret
 
 
 class Fetch:
@@ -139,6 +566,12 @@ class Fetch:
         as_dict=None,
         squeeze=False,
         download_path=".",
+        stream=False,
+        batch_size=None,
+        decode_workers=None,
+        download_workers=None,
+        lazy_blobs=False,
+        blob_info=False,
     ):
         """
         Fetches the expression results from the database into an np.array or list of dictionaries and
@@ -152,11 +585,24 @@ class Fetch:
                         if order_by=None. To reverse the order, add DESC to the attribute name or names: e.g. ("age DESC",
                         "frequency") To order by primary key, use "KEY" or "KEY DESC"
         :param format: Effective when as_dict=None and when attrs is empty None: default from config['fetch_format'] or
-                        'array' if not configured "array": use numpy.key_array "frame": output pandas.DataFrame. .
+                        'array' if not configured "array": use numpy.key_array "frame": output pandas.DataFrame.
+                        "arrow": output pyarrow.Table "polars": output polars.DataFrame.
         :param as_dict: returns a list of dictionaries instead of a record array. Defaults to False for .fetch() and to
                         True for .fetch('KEY')
         :param squeeze:  if True, remove extra dimensions from arrays
         :param download_path: for fetches that download data, e.g. attachments
+        :param stream: if True, return a generator of batches read through an unbuffered cursor so that only one
+                        batch is held in memory at a time. Other queries on the connection raise a DataJointError
+                        until the generator is exhausted or closed.
+        :param batch_size: the number of tuples per batch when stream=True. Default from config['fetch.batch_size']
+        :param decode_workers: the number of threads that decompress and unpack blobs concurrently.
+                        Default from config['fetch.decode_workers']
+        :param download_workers: the number of threads that download external blobs, attachments, and filepaths
+                        concurrently. Default from config['fetch.download_workers']
+        :param lazy_blobs: if True, blob attributes are returned as LazyBlob proxies that are unpacked upon first
+                        access or by calling their load() method. Not supported with the "arrow" and "polars" formats.
+        :param blob_info: if True, blob attributes are returned as dicts describing their contents (see
+                        dj.blob.inspect) without unpacking them
         :return: the contents of the table in the form of a structured numpy.array or a dict list
         """
         if offset or order_by or limit:
@@ -183,26 +629,34 @@ class Fetch:
                 "Cannot specify output format when as_dict=True or "
                 "when attributes are selected to be fetched separately."
             )
-        if format not in {None, "array", "frame"}:
+        if format not in {None, *fetch_formats}:
             raise DataJointError(
                 "Fetch output format must be in "
-                '{{"array", "frame"}} but "{}" was given'.format(format)
+                '{{"array", "frame", "arrow", "polars"}} but "{}" was given'.format(
+                    format
+                )
             )
 
         if not (attrs or as_dict) and format is None:
             format = config["fetch_format"]  # default to array
-            if format not in {"array", "frame"}:
+            if format not in fetch_formats:
                 raise DataJointError(
                     'Invalid entry "{}" in datajoint.config["fetch_format"]: '
-                    'use "array" or "frame"'.format(format)
+                    'use "array", "frame", "arrow", or "polars"'.format(format)
                 )
 
-        get = partial(
-            _get,
-            self._expression.connection,
-            squeeze=squeeze,
-            download_path=download_path,
-        )
+        if lazy_blobs and blob_info:
+            raise DataJointError("lazy_blobs and blob_info cannot be combined.")
+        if (lazy_blobs or blob_info) and format in ("arrow", "polars"):
+            raise DataJointError(
+                '{}=True is not supported with format="{}".'.format(
+                    "lazy_blobs" if lazy_blobs else "blob_info", format
+                )
+            )
+
+        if batch_size is not None and not stream:
+            raise DataJointError("batch_size can only be specified when stream=True.")
+
         if attrs:  # a list of attributes provided
             attributes = [a for a in attrs if not is_key(a)]
             ret = self._expression.proj(*attributes)
@@ -214,13 +668,20 @@ class Fetch:
                 squeeze=squeeze,
                 download_path=download_path,
                 format="array",
+                stream=stream,
+                batch_size=batch_size,
+                decode_workers=decode_workers,
+                download_workers=download_workers,
+                lazy_blobs=lazy_blobs,
+                blob_info=blob_info,
             )
-            if attrs_as_dict:
-                ret = [
-                    {k: v for k, v in zip(ret.dtype.names, x) if k in attrs}
-                    for x in ret
-                ]
-            else:
+
+            def split_attributes(ret):
+                if attrs_as_dict:
+                    return [
+                        {k: v for k, v in zip(ret.dtype.names, x) if k in attrs}
+                        for x in ret
+                    ]
                 return_values = [
                     (
                         list(
@@ -233,45 +694,81 @@ class Fetch:
                     )
                     for attribute in attrs
                 ]
-                ret = return_values[0] if len(attrs) == 1 else return_values
-        else:  # fetch all attributes as a numpy.record_array or pandas.DataFrame
-            cur = self._expression.cursor(as_dict=as_dict)
-            heading = self._expression.heading
-            if as_dict:
-                ret = [
-                    dict((name, get(heading[name], d[name])) for name in heading.names)
-                    for d in cur
-                ]
-            else:
-                ret = list(cur.fetchall())
-                record_type = (
-                    heading.as_dtype
-                    if not ret
-                    else np.dtype(
-                        [
-                            (
-                                (
-                                    name,
-                                    type(value),
-                                )  # use the first element to determine blob type
-                                if heading[name].is_blob
-                                and isinstance(value, numbers.Number)
-                                else (name, heading.as_dtype[name])
-                            )
-                            for value, name in zip(ret[0], heading.as_dtype.names)
-                        ]
-                    )
-                )
-                try:
-                    ret = np.array(ret, dtype=record_type)
-                except Exception as e:
-                    raise e
-                for name in heading:
-                    # unpack blobs and externals
-                    ret[name] = list(map(partial(get, heading[name]), ret[name]))
-                if format == "frame":
-                    ret = pandas.DataFrame(ret).set_index(heading.primary_key)
-        return ret
+                return return_values[0] if len(attrs) == 1 else return_values
+
+            return map(split_attributes, ret) if stream else split_attributes(ret)
+
+        # fetch all attributes as a numpy.record_array or pandas.DataFrame
+        heading = self._expression.heading
+        decode_workers = decode_workers or config["fetch.decode_workers"]
+        if decode_workers > 1:
+            # external tables issue their own queries upon first access: open them
+            # before decoding blobs concurrently
+            self._open_external_tables(heading)
+        decoder = _Decoder(
+            self._expression.connection,
+            squeeze=squeeze,
+            download_path=download_path,
+            decode_workers=decode_workers,
+            download_workers=download_workers or config["fetch.download_workers"],
+            lazy_blobs=lazy_blobs,
+            blob_info=blob_info,
+        )
+        if stream:
+            return self._stream(
+                heading,
+                decoder,
+                as_dict=as_dict,
+                format=format,
+                batch_size=batch_size or config["fetch.batch_size"],
+            )
+        cur = self._expression.cursor(as_dict=as_dict)
+        with decoder:
+            return _make_result(cur.fetchall(), heading, decoder, as_dict, format)
+
+    def _open_external_tables(self, heading):
+        connection = self._expression.connection
+        for attr in heading.attributes.values():
+            if attr.is_external:
+                connection.schemas[attr.database].external[attr.store]
+
+    def _stream(self, heading, decoder, as_dict, format, batch_size):
+        """
+        Prepare a generator of batches fetched through an unbuffered cursor.
+        """
+        if any(
+            attr.is_attachment or attr.is_filepath
+            for attr in heading.attributes.values()
+        ):
+            raise DataJointError(
+                "Attachment and filepath attributes cannot be fetched with stream=True. "
+                "Project them out of the query or fetch them separately."
+            )
+        if decoder.blob_info and any(
+            attr.is_blob and attr.is_external for attr in heading.attributes.values()
+        ):
+            # inspecting external blobs queries their tracking table, which would
+            # interrupt the unbuffered cursor
+            raise DataJointError(
+                "blob_info=True is not supported for external blobs with stream=True."
+            )
+        # external tables issue their own queries upon first access: open them before
+        # the unbuffered cursor occupies the connection
+        self._open_external_tables(heading)
+
+        def generate():
+            cur = self._expression.cursor(as_dict=as_dict, unbuffered=True)
+            try:
+                with decoder:
+                    while True:
+                        rows = cur.fetchmany(batch_size)
+                        if not rows:
+                            break
+                        yield _make_result(rows, heading, decoder, as_dict, format)
+            finally:
+                cur.close()
+
+        return generate()
 
 
 class Fetch1:
@@ -284,7 +781,14 @@ class Fetch1:
     def __init__(self, expression):
         self._expression = expression
 
-    def __call__(self, *attrs, squeeze=False, download_path="."):
+    def __call__(
+        self,
+        *attrs,
+        squeeze=False,
+        download_path=".",
+        lazy_blobs=False,
+        blob_slice=None,
+    ):
         """
         Fetches the result of a query expression that yields one entry.
 
@@ -299,10 +803,22 @@ class Fetch1:
                  If attrs is empty, the return result is a dict
         :param squeeze:  When true, remove extra dimensions from arrays in attributes
         :param download_path: for fetches that download data, e.g. attachments
+        :param lazy_blobs: if True, blob attributes are returned as LazyBlob proxies that are unpacked upon first
+                 access or by calling their load() method
+        :param blob_slice: index along the leading axis of the array in a single blob attribute, e.g.
+                 np.s_[1000:1100]. For arrays packed in chunks (see dj.config["blob.chunk_size"]), only the
+                 chunks containing the slice are read from the database or the external store.
         :return: the one tuple in the table in the form of a dict
         """
         heading = self._expression.heading
 
+        if blob_slice is not None:
+            if len(attrs) != 1 or not heading[attrs[0]].is_blob:
+                raise DataJointError(
+                    "blob_slice requires fetching exactly one blob attribute."
+                )
+            return self._fetch_slice(heading[attrs[0]], blob_slice, squeeze)
+
         if not attrs:  # fetch all attributes, return as ordered dict
             cur = self._expression.cursor(as_dict=True)
             ret = cur.fetchone()
@@ -310,15 +826,21 @@ class Fetch1:
                 raise DataJointError(
                     "fetch1 requires exactly one tuple in the input set."
                 )
+            get = partial(
+                _get,
+                self._expression.connection,
+                squeeze=squeeze,
+                download_path=download_path,
+            )
             ret = dict(
                 (
                     name,
-                    _get(
-                        self._expression.connection,
-                        heading[name],
-                        ret[name],
-                        squeeze=squeeze,
-                        download_path=download_path,
+                    (
+                        LazyBlob(partial(get, heading[name]), ret[name])
+                        if lazy_blobs
+                        and heading[name].is_blob
+                        and ret[name] is not None
+                        else get(heading[name], ret[name])
                     ),
                 )
                 for name in heading.names
@@ -326,7 +848,10 @@ class Fetch1:
         else:  # fetch some attributes, return as tuple
             attributes = [a for a in attrs if not is_key(a)]
             result = self._expression.proj(*attributes).fetch(
-                squeeze=squeeze, download_path=download_path, format="array"
+                squeeze=squeeze,
+                download_path=download_path,
+                format="array",
+                lazy_blobs=lazy_blobs,
             )
             if len(result) != 1:
                 raise DataJointError(
@@ -342,3 +867,38 @@ class Fetch1:
             )
             ret = return_values[0] if len(attrs) == 1 else return_values
         return ret
+
+    def _fetch_slice(self, attr, index, squeeze):
+        """
+        Read a slice of the array in a blob attribute, retrieving only the byte ranges needed.
+        """
+        if attr.adapter:
+            raise DataJointError(
+                "blob_slice is not supported for adapted attribute `{}`".format(
+                    attr.name
+                )
+            )
+        if attr.is_external:
+            # the hash of the external object is retrieved as a computed attribute
+            data = self._expression.proj(_hash="`{}`".format(attr.name)).fetch1("_hash")
+            if data is None:
+                return None
+            extern = self._expression.connection.schemas[attr.database].external[
+                attr.store
+            ]
+            read = partial(extern.get_range, uuid.UUID(bytes=data))
+        else:
+
+            def read(offset, size):
+                # the range is retrieved from the database as a computed attribute
+                return self._expression.proj(
+                    _range=(
+                        "`{}`".format(attr.name)
+                        if size is None
+                        else "SUBSTRING(`{}`, {}, {})".format(
+                            attr.name, offset + 1, size
+                        )
+                    )
+                ).fetch1("_range")
+
+        return blob.unpack_slice(read, index, squeeze=squeeze)
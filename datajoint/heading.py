@@ -7,6 +7,7 @@ import numpy as np
 
 from .attribute_adapter import AttributeAdapter, get_adapter
 from .declare import (
+    CODEC_PATTERN,
     EXTERNAL_TYPES,
     NATIVE_TYPES,
     SPECIAL_TYPES,
@@ -37,6 +38,8 @@ default_attribute_properties = (
         is_hidden=False,
         adapter=None,
         store=None,
+        codec=None,
+        compression_level=None,
         unsupported=False,
         attribute_expression=None,
         database=None,
@@ -383,6 +386,15 @@ class Heading:
                     ),
                 )
 
+            # compression codec specified in the comment of a blob attribute
+            codec = attr["is_blob"] and CODEC_PATTERN.match(attr["comment"])
+            attr.update(
+                codec=codec["codec"] if codec else None,
+                compression_level=(
+                    int(codec["level"]) if codec and codec["level"] else None
+                ),
+            )
+
             if attr["in_key"] and any(
                 (
                     attr["is_blob"],
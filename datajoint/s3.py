@@ -62,6 +62,11 @@ class Folder:
             self.bucket, str(name), BytesIO(buffer), length=len(buffer)
         )
 
+    def put_stream(self, name, stream, size):
+        """upload size bytes read from a binary file object"""
+        logger.debug("put_stream: {}:{}".format(self.bucket, name))
+        return self.client.put_object(self.bucket, str(name), stream, length=size)
+
     def fput(self, local_file, name, metadata=None):
         logger.debug("fput: {} -> {}:{}".format(self.bucket, local_file, name))
         return self.client.fput_object(
@@ -80,6 +85,37 @@ class Folder:
             else:
                 raise e
 
+    def open(self, name):
+        """
+        :return: a binary file object streaming the contents of the object. Close it to
+            release the connection.
+        """
+        logger.debug("open: {}:{}".format(self.bucket, name))
+        try:
+            return self.client.get_object(self.bucket, str(name))
+        except minio.error.S3Error as e:
+            if e.code == "NoSuchKey":
+                raise errors.MissingExternalFile("Missing s3 key %s" % name)
+            else:
+                raise e
+
+    def get_range(self, name, offset, size):
+        """get size bytes of an object starting at offset"""
+        logger.debug(
+            "get_range: {}:{} [{}:+{}]".format(self.bucket, name, offset, size)
+        )
+        try:
+            with self.client.get_object(
+                self.bucket, str(name), offset=offset, length=size
+            ) as result:
+                data = [d for d in result.stream()]
+            return b"".join(data)
+        except minio.error.S3Error as e:
+            if e.code == "NoSuchKey":
+                raise errors.MissingExternalFile("Missing s3 key %s" % name)
+            else:
+                raise e
+
     def fget(self, name, local_filepath):
         """get file from object name to local filepath"""
         logger.debug("fget: {}:{}".format(self.bucket, name))
@@ -20,6 +20,21 @@ DEFAULT_SUBFOLDING = (2, 2)
 
 validators = collections.defaultdict(lambda: lambda value: True)
 validators["database.port"] = lambda a: isinstance(a, int)
+validators["fetch.batch_size"] = lambda a: isinstance(a, int) and a > 0
+validators["fetch.decode_workers"] = lambda a: isinstance(a, int) and a > 0
+validators["fetch.download_workers"] = lambda a: isinstance(a, int) and a > 0
+validators["blob.codec"] = lambda a: isinstance(a, str)
+validators["blob.compression_level"] = lambda a: a is None or isinstance(a, int)
+validators["blob.filters"] = lambda a: isinstance(a, (list, tuple))
+validators["blob.chunk_size"] = lambda a: a is None or isinstance(a, int) and a > 0
+validators["blob.compact_sequences"] = lambda a: isinstance(a, bool)
+validators["blob.pickle"] = lambda a: isinstance(a, bool)
+validators["insert.batch_size"] = lambda a: a is None or isinstance(a, int) and a > 0
+validators["insert.pack_workers"] = lambda a: isinstance(a, int) and a > 0
+validators["insert.upload_workers"] = lambda a: isinstance(a, int) and a > 0
+validators["external.skip_existing"] = lambda a: isinstance(a, bool)
+validators["external.verify_existing"] = lambda a: isinstance(a, bool)
+validators["external.hash_cache_size"] = lambda a: isinstance(a, int) and a >= 0
 
 Role = Enum("Role", "manual lookup imported computed job")
 role_to_prefix = {
@@ -43,6 +58,21 @@ default = dict(
         "loglevel": "INFO",
         "safemode": True,
         "fetch_format": "array",
+        "fetch.batch_size": 1000,
+        "fetch.decode_workers": 1,
+        "fetch.download_workers": 4,
+        "blob.codec": "zlib",
+        "blob.compression_level": None,
+        "blob.filters": [],
+        "blob.chunk_size": None,
+        "blob.compact_sequences": False,  # lists of scalars as typed arrays
+        "blob.pickle": False,  # pickle unsupported types; unpickling trusts the data
+        "insert.batch_size": 10000,  # max rows per INSERT statement
+        "insert.pack_workers": 1,
+        "insert.upload_workers": 4,
+        "external.skip_existing": True,  # do not upload objects already stored
+        "external.verify_existing": True,  # check the store for tracked objects
+        "external.hash_cache_size": 0,  # hashes of stored objects cached in memory
         "display.limit": 12,
         "display.width": 14,
         "display.show_tuple_count": True,
@@ -147,7 +177,14 @@ class Config(collections.abc.MutableMapping):
 
         spec["subfolding"] = spec.get("subfolding", DEFAULT_SUBFOLDING)
         spec_keys = {  # REQUIRED in uppercase and allowed in lowercase
-            "file": ("PROTOCOL", "LOCATION", "subfolding", "stage"),
+            "file": (
+                "PROTOCOL",
+                "LOCATION",
+                "subfolding",
+                "stage",
+                "codec",
+                "compression_level",
+            ),
             "s3": (
                 "PROTOCOL",
                 "ENDPOINT",
@@ -159,6 +196,8 @@ class Config(collections.abc.MutableMapping):
                 "subfolding",
                 "stage",
                 "proxy_server",
+                "codec",
+                "compression_level",
             ),
         }
 
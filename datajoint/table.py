@@ -4,14 +4,22 @@ import inspect
 import itertools
 import json
 import logging
+import math
+import operator
 import platform
 import re
+import sys
+import tempfile
+import threading
 import uuid
+import weakref
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
 from typing import Union
 
 import numpy as np
 import pandas
+from tqdm import tqdm
 
 from . import blob
 from .condition import make_condition
@@ -51,6 +59,203 @@ constraint_info_query = " ".join(
 )
 
 
+# compiled insert plans of each heading, see Table.__make_insert_plan
+_insert_plans = weakref.WeakKeyDictionary()
+
+# characters that the client escapes in quoted strings
+_escaped_characters = (b"\0", b"\n", b"\r", b"\x1a", b"'", b'"', b"\\")
+
+
+def _row_size(row):
+    """
+    :param row: the placeholders and values of a row produced by
+        Table.__make_rows_to_insert
+    :return: the number of bytes that the row takes in an INSERT query
+    """
+    placeholders, values = row
+    # parentheses, commas, and placeholders other than %s, such as DEFAULT
+    size = 2 + len(placeholders) + sum(len(p) for p in placeholders if p != "%s")
+    text = []
+    for value in values:
+        if isinstance(value, (bytes, bytearray)):
+            # binary values are sent as _binary'...' with backslash escapes, which at
+            # most double each byte
+            size += 2 * len(value) + 11
+        elif value is not None:
+            text.append(str(value))
+    if text:
+        # quoted strings, with escaped characters counted once for the entire row
+        size += 2 * len(text)
+        text = "".join(text).encode()
+        size += len(text)
+        size += sum(text.count(c) for c in _escaped_characters)
+    return size
+
+
+def _row_sql(rows):
+    """
+    :param rows: the placeholders and values of rows produced by
+        Table.__make_rows_to_insert
+    :return: the VALUES tuples of the rows and the arguments for their placeholders
+    """
+    return (
+        ["(" + ",".join(placeholders) + ")" for placeholders, _ in rows],
+        [v for _, values in rows for v in values if v is not None],
+    )
+
+
+def _collect_row(converted):
+    """
+    :param converted: the placeholder and value of each field of a row, or futures of
+        them for fields converted on other threads
+    :return: the placeholders and values of the row
+    """
+    return tuple(zip(*(c.result() if isinstance(c, Future) else c for c in converted)))
+
+
+def _apply(function, *args):
+    """call function on the calling thread in place of submitting it to an executor"""
+    return function(*args)
+
+
+class _StagedUploads:
+    """
+    Objects to be uploaded to external stores by an insert. The converters of external
+    blobs and attachments hash the objects and stage their uploads, possibly on other
+    threads. The staged objects are uploaded before the rows referencing them are
+    inserted, with one lookup of the objects already stored and one tracking query per
+    store, see ExternalTable.upload_staged.
+
+    :param workers: the number of concurrent uploads
+    """
+
+    def __init__(self, workers):
+        self.workers = workers
+        self.limit = workers * blob.spool_size  # bytes of blobs held before uploading
+        self.tracked = None  # set to a list to collect the tracking entries recorded
+        self._items = []
+        self._size = 0
+        self._lock = threading.Lock()
+
+    def append(self, item):
+        """
+        :param item: (external table, tracking entry, external path, source) of an object
+        """
+        with self._lock:
+            self._items.append(item)
+            if not isinstance(item[3], Path):
+                self._size += item[1]["size"]
+
+    @property
+    def full(self):
+        """:return: True if the staged blobs should be uploaded to bound memory use"""
+        return self._size > self.limit
+
+    def _take(self):
+        with self._lock:
+            items, self._items, self._size = self._items, [], 0
+        return items
+
+    def upload(self):
+        """upload and track the staged objects"""
+        items = self._take()
+        stores = {}
+        for external, *item in items:
+            stores.setdefault(external.full_table_name, (external, []))[1].append(item)
+        try:
+            for external, store_items in stores.values():
+                external.upload_staged(store_items, self.workers, self.tracked)
+        finally:
+            _close_sources(items)
+
+    def discard(self):
+        """release the staged objects that will not be uploaded"""
+        _close_sources(self._take())
+
+    def retrack(self):
+        """record the tracking entries collected in self.tracked again"""
+        stores = {}
+        for external, entry in self.tracked:
+            stores.setdefault(external.full_table_name, (external, []))[1].append(entry)
+        for external, entries in stores.values():
+            external.insert_tracking(entries)
+
+
+def _close_sources(items):
+    for *_, source in items:
+        if not isinstance(source, Path):
+            source.close()
+
+
+def _literal_size(row):
+    """
+    :param row: the rendered VALUES tuple of a row
+    :return: the number of bytes that the row takes in an INSERT query
+    """
+    return len(row.encode()) + 1
+
+
+def _literal_sql(rows):
+    """
+    :param rows: rendered VALUES tuples
+    :return: the VALUES tuples and None for their arguments, as they have no placeholders
+    """
+    return rows, None
+
+
+def _is_vectorizable(attr, column):
+    """
+    :param attr: the attribute to be inserted
+    :param column: a numpy array of its values
+    :return: True if the column can be rendered into SQL literals by _render_column
+    """
+    if (
+        column.ndim != 1
+        or attr.adapter
+        or attr.is_blob
+        or attr.is_attachment
+        or attr.is_filepath
+        or attr.uuid
+        or attr.json
+    ):
+        return False
+    return column.dtype.kind in ("biuf" if attr.numeric else "UOM")
+
+
+def _render_column(attr, column, escape):
+    """
+    Prepare a column of values for rendering into SQL literals, vectorized where
+    possible. Missing values become DEFAULT: NaN in float columns, NaT in datetime
+    columns, and None. As in inserts row by row, NaN in other columns is sent as is.
+
+    :param attr: the attribute to be inserted
+    :param column: a numpy array of values that passes _is_vectorizable
+    :param escape: function that quotes and escapes a value for the connection
+    :return: the format of the column's field in the VALUES tuple and the list of values
+    """
+    kind = column.dtype.kind
+    if kind in "biu":
+        return "'%s'", (column.astype(np.uint8) if kind == "b" else column).tolist()
+    if kind in "fM":
+        missing = np.isnan(column) if kind == "f" else np.isnat(column)
+        # python floats format the exact float64 value, which is stored unchanged in
+        # float columns; the shorter numpy str of float32 values suits double columns
+        values = (
+            column.tolist()
+            if column.dtype == np.float64
+            or kind == "f"
+            and attr.type.startswith("float")
+            else column.astype(str).tolist()
+        )
+        if not missing.any():
+            return "'%s'", values
+        values = ["'%s'" % v for v in values]
+        for i in np.flatnonzero(missing).tolist():
+            values[i] = "DEFAULT"
+        return "%s", values
+    return "%s", ["DEFAULT" if v is None else escape(v) for v in column.tolist()]
+
+
 class _RenameMap(tuple):
     """for internal use"""
 
@@ -328,7 +533,7 @@ class Table(QueryExpression):
             raise DataJointError("Update can only be applied to one existing entry.")
         # UPDATE query
         row = [
-            self.__make_placeholder(k, v)
+            (k,) + self.__make_converter(self.heading[k])(v)
             for k, v in row.items()
             if k not in self.primary_key
         ]
@@ -355,20 +560,40 @@ class Table(QueryExpression):
         skip_duplicates=False,
         ignore_extra_fields=False,
         allow_direct_insert=None,
+        batch_size=None,
+        commit_batches=False,
+        display_progress=False,
+        pack_workers=None,
+        upload_workers=None,
     ):
         """
         Insert a collection of rows.
 
+        Rows are inserted in batches, each in one INSERT statement that does not exceed
+        the server's max_allowed_packet. Unless commit_batches is set, an insert that
+        takes several statements is performed in one transaction.
+
         :param rows: Either (a) an iterable where an element is a numpy record, a
             dict-like object, a pandas.DataFrame, a sequence, or a query expression with
             the same heading as self, or (b) a pathlib.Path object specifying a path
             relative to the current directory with a CSV file, the contents of which
-            will be inserted.
+            will be inserted. Iterators and generators are consumed lazily, one batch at
+            a time. Data frames, structured arrays, and pyarrow.Table objects are
+            processed column by column.
         :param replace: If True, replaces the existing tuple.
         :param skip_duplicates: If True, silently skip duplicate inserts.
         :param ignore_extra_fields: If False, fields that are not in the heading raise error.
         :param allow_direct_insert: Only applies in auto-populated tables. If False (default),
             insert may only be called from inside the make callback.
+        :param batch_size: maximum number of rows per INSERT statement. Defaults to
+            dj.config["insert.batch_size"]; None limits batches only by their size.
+        :param commit_batches: If True, each batch is committed on its own, so that the
+            batches inserted before an error are kept. Not allowed inside a transaction.
+        :param display_progress: If True, report the progress of the inserted rows.
+        :param pack_workers: the number of threads that serialize and compress blobs
+            concurrently. Defaults to dj.config["insert.pack_workers"].
+        :param upload_workers: the number of threads that upload blobs and attachments to
+            external stores concurrently. Defaults to dj.config["insert.upload_workers"].
 
         Example:
 
@@ -384,8 +609,20 @@ class Table(QueryExpression):
             ).to_records(index=False)
 
         if isinstance(rows, Path):
+            # read the rows lazily while the file is open
             with open(rows, newline="") as data_file:
-                rows = list(csv.DictReader(data_file, delimiter=","))
+                return self.insert(
+                    csv.DictReader(data_file, delimiter=","),
+                    replace=replace,
+                    skip_duplicates=skip_duplicates,
+                    ignore_extra_fields=ignore_extra_fields,
+                    allow_direct_insert=allow_direct_insert,
+                    batch_size=batch_size,
+                    commit_batches=commit_batches,
+                    display_progress=display_progress,
+                    pack_workers=pack_workers,
+                    upload_workers=upload_workers,
+                )
 
         # prohibit direct inserts into auto-populated tables
         if not allow_direct_insert and not getattr(self, "_allow_insert", True):
@@ -427,45 +664,215 @@ class Table(QueryExpression):
             self.connection.query(query)
             return
 
-        # collects the field list from first row (passed by reference)
+        if commit_batches and self.connection.in_transaction:
+            raise DataJointError(
+                "commit_batches=True cannot be used inside a transaction."
+            )
         field_list = []
-        rows = list(
-            self.__make_row_to_insert(row, field_list, ignore_extra_fields)
-            for row in rows
+        upload_workers = upload_workers or config["insert.upload_workers"]
+        staged = _StagedUploads(upload_workers)  # objects to upload to external stores
+        columns = self.__make_columns_to_insert(rows, field_list, ignore_extra_fields)
+        if columns is not None:
+            # structured arrays and Arrow tables are rendered column by column
+            rows_to_insert = self.__render_rows(columns)
+            row_size, row_sql = _literal_size, _literal_sql
+        else:
+            # rows are packed lazily and sent in batches, so that memory use is bounded
+            # by the size of a batch. The field list is collected from the first row.
+            pa = sys.modules.get("pyarrow")
+            if pa is not None and isinstance(rows, pa.Table):
+                rows = rows.to_pylist()
+            rows_to_insert = self.__make_rows_to_insert(
+                rows,
+                field_list,
+                ignore_extra_fields,
+                pack_workers or config["insert.pack_workers"],
+                upload_workers,
+                staged,
+            )
+            row_size, row_sql = _row_size, _row_sql
+        batches = self.__split_batches(rows_to_insert, field_list, batch_size, row_size)
+        try:
+            first = next(batches, None)
+            second = next(batches, None) if first is not None else None
+        except:
+            rows_to_insert.close()
+            staged.discard()
+            raise
+        if first is None:
+            return
+        # without commit_batches, a multi-statement insert remains all-or-nothing
+        atomic = (
+            second is not None
+            and not commit_batches
+            and not self.connection.in_transaction
         )
-        if rows:
-            try:
-                query = "{command} INTO {destination}(`{fields}`) VALUES {placeholders}{duplicate}".format(
-                    command="REPLACE" if replace else "INSERT",
-                    destination=self.from_clause(),
-                    fields="`,`".join(field_list),
-                    placeholders=",".join(
-                        "(" + ",".join(row["placeholders"]) + ")" for row in rows
-                    ),
-                    duplicate=(
-                        " ON DUPLICATE KEY UPDATE `{pk}`=`{pk}`".format(
-                            pk=self.primary_key[0]
-                        )
-                        if skip_duplicates
-                        else ""
-                    ),
+        batches = itertools.chain(
+            [first] if second is None else [first, second], batches
+        )
+        del first, second
+        progress = (
+            tqdm(
+                total=len(rows) if hasattr(rows, "__len__") else None,
+                desc=self.__class__.__name__,
+                unit="rows",
+            )
+            if display_progress
+            else None
+        )
+        if atomic:
+            # objects tracked inside the transaction
+            staged.tracked = []
+            self.connection.start_transaction()
+        try:
+            for batch in batches:
+                # external objects must be stored and tracked before the rows that
+                # reference them
+                staged.upload()
+                self.__insert_batch(
+                    *row_sql(batch), field_list, replace, skip_duplicates
                 )
-                self.connection.query(
-                    query,
-                    args=list(
-                        itertools.chain.from_iterable(
-                            (v for v in r["values"] if v is not None) for r in rows
-                        )
-                    ),
+                if progress is not None:
+                    progress.update(len(batch))
+                logger.debug(
+                    "Inserted %d rows into %s" % (len(batch), self.full_table_name)
                 )
-            except UnknownAttributeError as err:
-                raise err.suggest(
-                    "To ignore extra fields in insert, set ignore_extra_fields=True"
+        except:
+            rows_to_insert.close()  # wait for the objects being staged
+            staged.discard()
+            if atomic:
+                self.connection.cancel_transaction()
+                # uploaded objects remain in the stores: track them outside of the
+                # rolled back transaction so that they are not orphaned
+                staged.retrack()
+            raise
+        else:
+            if atomic:
+                self.connection.commit_transaction()
+        finally:
+            if progress is not None:
+                progress.close()
+
+    def __split_batches(self, rows, field_list, batch_size, row_size):
+        """
+        Split rows into batches that fit into single INSERT statements.
+
+        :param rows: iterable of rows to insert
+        :param field_list: names of the inserted fields, filled in by the first row
+        :param batch_size: maximum number of rows per batch or None for
+            dj.config["insert.batch_size"]
+        :param row_size: function returning the number of bytes of a row in the query
+        :return: generator of lists of rows
+        """
+        if batch_size is None:
+            batch_size = config["insert.batch_size"]
+        max_bytes = None
+        batch, size = [], 0
+        for row in rows:
+            if max_bytes is None:
+                # the field list is known after the first row;
+                # leave room for the statement text and the packet header
+                max_bytes = self.connection.max_allowed_packet - (
+                    1024 + len(self.from_clause()) + sum(len(f) + 3 for f in field_list)
                 )
-            except DuplicateError as err:
-                raise err.suggest(
-                    "To ignore duplicate entries in insert, set skip_duplicates=True"
+            nbytes = row_size(row)
+            if batch and (
+                size + nbytes > max_bytes or batch_size and len(batch) >= batch_size
+            ):
+                yield batch
+                batch, size = [], 0
+            batch.append(row)
+            size += nbytes
+        if batch:
+            yield batch
+
+    def __insert_batch(self, values, args, field_list, replace, skip_duplicates):
+        """
+        Insert rows in one INSERT statement.
+
+        :param values: the parenthesized VALUES tuple of each row
+        :param args: arguments for the placeholders in values or None if there are none
+        """
+        try:
+            query = "{command} INTO {destination}(`{fields}`) VALUES {placeholders}{duplicate}".format(
+                command="REPLACE" if replace else "INSERT",
+                destination=self.from_clause(),
+                fields="`,`".join(field_list),
+                placeholders=",".join(values),
+                duplicate=(
+                    " ON DUPLICATE KEY UPDATE `{pk}`=`{pk}`".format(
+                        pk=self.primary_key[0]
+                    )
+                    if skip_duplicates
+                    else ""
+                ),
+            )
+            self.connection.query(query, args=args)
+        except UnknownAttributeError as err:
+            raise err.suggest(
+                "To ignore extra fields in insert, set ignore_extra_fields=True"
+            )
+        except DuplicateError as err:
+            raise err.suggest(
+                "To ignore duplicate entries in insert, set skip_duplicates=True"
+            )
+
+    def __make_columns_to_insert(self, rows, field_list, ignore_extra_fields):
+        """
+        Collect the columns of a structured numpy array or a pyarrow.Table for a
+        vectorized insert.
+
+        :param rows: the rows passed to insert
+        :param field_list: filled in with the names of the inserted fields
+        :return: list of (attribute, column) pairs or None if the rows must be inserted
+            one by one
+        """
+        pa = sys.modules.get("pyarrow")
+        is_arrow = pa is not None and isinstance(rows, pa.Table)
+        if is_arrow:
+            names = rows.column_names
+        elif isinstance(rows, np.ndarray) and rows.dtype.names and rows.ndim == 1:
+            names = rows.dtype.names
+        else:
+            return None
+        if not ignore_extra_fields:
+            for name in names:
+                if name not in self.heading:
+                    raise KeyError("`{0:s}` is not in the table heading".format(name))
+        columns = [
+            (
+                self.heading[name],
+                rows.column(name).to_numpy() if is_arrow else rows[name],
+            )
+            for name in self.heading
+            if name in names
+        ]
+        if not columns or not all(
+            _is_vectorizable(attr, column) for attr, column in columns
+        ):
+            return None
+        field_list.extend(attr.name for attr, _ in columns)
+        return columns
+
+    def __render_rows(self, columns):
+        """
+        Render rows into the VALUES tuples of an INSERT query, one slice of the columns
+        at a time.
+
+        :param columns: list of (attribute, column) pairs from __make_columns_to_insert
+        :return: generator of VALUES tuples, one per row
+        """
+        escape = self.connection.escape
+        step = config["insert.batch_size"] or 10000
+        for start in range(0, len(columns[0][1]), step):
+            formats, values = zip(
+                *(
+                    _render_column(attr, column[start : start + step], escape)
+                    for attr, column in columns
                 )
+            )
+            template = "(" + ",".join(formats) + ")"
+            yield from (template % row for row in zip(*values))
 
     def delete_quick(self, get_count=False):
         """
@@ -819,26 +1226,20 @@ class Table(QueryExpression):
         return definition
 
     # --- private helper functions ----
-    def __make_placeholder(self, name, value, ignore_extra_fields=False):
+    def __make_converter(self, attr):
         """
-        For a given attribute `name` with `value`, return its processed value or value placeholder
-        as a string to be included in the query and the value, if any, to be submitted for
-        processing by mysql API.
+        Compile the conversion of values of an attribute for insert and update queries.
 
-        :param name:  name of attribute to be inserted
-        :param value: value of attribute to be inserted
+        :param attr: the attribute to be inserted
+        :return: function mapping a value to its placeholder in the query and the value,
+            if any, to be submitted for processing by mysql API. The function of external
+            blobs and attachments accepts a _StagedUploads object collecting their uploads,
+            see ExternalTable.put_stream.
         """
-        if ignore_extra_fields and name not in self.heading:
-            return None
-        attr = self.heading[name]
-        if attr.adapter:
-            value = attr.adapter.put(value)
-        if value is None or (attr.numeric and (value == "" or np.isnan(float(value)))):
-            # set default value
-            placeholder, value = "DEFAULT", None
-        else:  # not NULL
-            placeholder = "%s"
-            if attr.uuid:
+        name = attr.name
+        if attr.uuid:
+
+            def convert(value):
                 if not isinstance(value, uuid.UUID):
                     try:
                         value = uuid.UUID(value)
@@ -848,109 +1249,264 @@ class Table(QueryExpression):
                                 v=value, n=name
                             )
                         )
-                value = value.bytes
-            elif attr.is_blob:
-                value = blob.pack(value)
-                value = (
-                    self.external[attr.store].put(value).bytes
-                    if attr.is_external
-                    else value
-                )
-            elif attr.is_attachment:
+                return value.bytes
+
+        elif attr.is_blob and attr.is_external:
+            external = self.external[attr.store]
+
+            def convert(value, staged=None):
+                # the codec specified for the attribute takes precedence over the store's
+                codec, level = attr.codec, attr.compression_level
+                if codec is None:
+                    codec = external.spec.get("codec")
+                    level = external.spec.get("compression_level")
+                # stream through a temporary file to bound the memory used by large blobs.
+                # A staged file remains open until it is uploaded.
+                f = tempfile.SpooledTemporaryFile(max_size=blob.spool_size)
+                try:
+                    blob.pack_to(f, value, codec=codec, level=level)
+                    hash_ = external.put_stream(f, staged)
+                except:
+                    f.close()
+                    raise
+                if staged is None:
+                    f.close()
+                return hash_.bytes
+
+        elif attr.is_blob:
+
+            def convert(value):
+                return blob.pack(value, codec=attr.codec, level=attr.compression_level)
+
+        elif attr.is_attachment and attr.is_external:
+            external = self.external[attr.store]
+
+            def convert(value, staged=None):
+                # value is hash of contents
+                return external.upload_attachment(Path(value), staged).bytes
+
+        elif attr.is_attachment:
+
+            def convert(value):
+                # value is filename + contents
                 attachment_path = Path(value)
-                if attr.is_external:
-                    # value is hash of contents
-                    value = (
-                        self.external[attr.store]
-                        .upload_attachment(attachment_path)
-                        .bytes
-                    )
-                else:
-                    # value is filename + contents
-                    value = (
-                        str.encode(attachment_path.name)
-                        + b"\0"
-                        + attachment_path.read_bytes()
-                    )
-            elif attr.is_filepath:
-                value = self.external[attr.store].upload_filepath(value).bytes
-            elif attr.numeric:
-                value = str(int(value) if isinstance(value, bool) else value)
-            elif attr.json:
-                value = json.dumps(value)
-        return name, placeholder, value
-
-    def __make_row_to_insert(self, row, field_list, ignore_extra_fields):
+                return (
+                    str.encode(attachment_path.name)
+                    + b"\0"
+                    + attachment_path.read_bytes()
+                )
+
+        elif attr.is_filepath:
+            external = self.external[attr.store]
+
+            def convert(value):
+                return external.upload_filepath(value).bytes
+
+        elif attr.numeric:
+
+            def convert(value):
+                return str(int(value) if isinstance(value, bool) else value)
+
+        elif attr.json:
+            convert = json.dumps
+        else:
+            convert = None
+
+        adapter, numeric = attr.adapter, attr.numeric
+
+        def make_placeholder(value, *staged):
+            if adapter:
+                value = adapter.put(value)
+            if value is None or (numeric and (value == "" or math.isnan(float(value)))):
+                # set default value
+                return "DEFAULT", None
+            return "%s", value if convert is None else convert(value, *staged)
+
+        return make_placeholder
+
+    def __make_insert_plan(self, fields, ignore_extra_fields):
         """
-        Helper function for insert and update
+        Compile the conversion of rows with the given fields for insert, cached for the
+        heading of the table.
 
-        :param row:  A tuple to insert
-        :return: a dict with fields 'names', 'placeholders', 'values'
+        :param fields: field names of the rows or None for positional rows
+        :param ignore_extra_fields: If False, fields that are not in the heading raise error.
+        :return: the names of the inserted fields in the order of the heading, a function
+            extracting their values from a row, the converter of each field, the
+            positions of the blobs that can be packed on other threads, and the positions
+            of the external blobs and attachments that can be uploaded on other threads
         """
+        key = None if fields is None else frozenset(fields), ignore_extra_fields
+        plans = _insert_plans.setdefault(self.heading, {})
+        try:
+            return plans[key]
+        except KeyError:
+            pass
+        attributes = self.heading.attributes
+        if fields is None:
+            names = list(attributes)
+            get_values = tuple
+        else:
+            if not ignore_extra_fields:
+                for field in fields:
+                    if field not in attributes:
+                        raise KeyError(
+                            "`{0:s}` is not in the table heading".format(field)
+                        )
+            names = [name for name in attributes if name in key[0]]
+            assert names, "Empty tuple"
+            get_values = (
+                operator.itemgetter(*names)
+                if len(names) > 1
+                else lambda row: (row[names[0]],)
+            )
+        plan = (
+            names,
+            get_values,
+            [self.__make_converter(attributes[n]) for n in names],
+            # serialization and compression of blobs stored in the table
+            frozenset(
+                i
+                for i, n in enumerate(names)
+                if attributes[n].is_blob
+                and not attributes[n].is_external
+                and not attributes[n].adapter
+            ),
+            # staged uploads to external stores
+            frozenset(
+                i
+                for i, n in enumerate(names)
+                if (attributes[n].is_blob or attributes[n].is_attachment)
+                and attributes[n].is_external
+                and not attributes[n].adapter
+            ),
+        )
+        plans[key] = plan
+        return plan
+
+    def __make_rows_to_insert(
+        self,
+        rows,
+        field_list,
+        ignore_extra_fields,
+        pack_workers=1,
+        upload_workers=1,
+        staged=None,
+    ):
+        """
+        Convert rows for insertion, running each row through the compiled insert plan
+        for its fields.
 
-        def check_fields(fields):
-            """
-            Validates that all items in `fields` are valid attributes in the heading
-
-            :param fields: field names of a tuple
-            """
-            if not field_list:
-                if not ignore_extra_fields:
-                    for field in fields:
-                        if field not in self.heading:
-                            raise KeyError(
-                                "`{0:s}` is not in the table heading".format(field)
+        :param rows: iterable of numpy records, dict-like objects, or sequences
+        :param field_list: filled in with the names of the inserted fields
+        :param ignore_extra_fields: If False, fields that are not in the heading raise error.
+        :param pack_workers: the number of threads that pack blobs concurrently
+        :param upload_workers: the number of threads that pack and hash objects to upload
+            to external stores concurrently
+        :param staged: _StagedUploads object collecting the objects to upload to external
+            stores, which are uploaded when it is full. If None, objects are uploaded one
+            by one.
+        :return: generator of (placeholders, values) of each row in the order of field_list
+        """
+        fields = get_values = converters = packs = uploads = None
+        concurrent = False
+        n_attributes = len(self.heading)
+        pack_executor = upload_executor = None
+        pack = upload = _apply  # replaced by the submit methods of the executors
+        pending = collections.deque()  # rows whose blobs are being packed or uploaded
+        window = 2 * max(pack_workers, upload_workers)
+        try:
+            for row in rows:
+                if uploads and staged.full:
+                    # bound the memory held by the staged blobs
+                    staged.upload()
+                if isinstance(row, np.void):  # np.array
+                    row_fields = row.dtype.names
+                elif isinstance(row, collections.abc.Mapping):  # dict-based
+                    row_fields = row.keys()
+                else:  # positional
+                    try:
+                        if len(row) != n_attributes:
+                            raise DataJointError(
+                                "Invalid insert argument. Incorrect number of attributes: "
+                                "{given} given; {expected} expected".format(
+                                    given=len(row), expected=n_attributes
+                                )
                             )
-            elif set(field_list) != set(fields).intersection(self.heading.names):
-                raise DataJointError("Attempt to insert rows with different fields.")
-
-        if isinstance(row, np.void):  # np.array
-            check_fields(row.dtype.fields)
-            attributes = [
-                self.__make_placeholder(name, row[name], ignore_extra_fields)
-                for name in self.heading
-                if name in row.dtype.fields
-            ]
-        elif isinstance(row, collections.abc.Mapping):  # dict-based
-            check_fields(row)
-            attributes = [
-                self.__make_placeholder(name, row[name], ignore_extra_fields)
-                for name in self.heading
-                if name in row
-            ]
-        else:  # positional
-            try:
-                if len(row) != len(self.heading):
-                    raise DataJointError(
-                        "Invalid insert argument. Incorrect number of attributes: "
-                        "{given} given; {expected} expected".format(
-                            given=len(row), expected=len(self.heading)
+                    except TypeError:
+                        raise DataJointError(
+                            "Datatype %s cannot be inserted" % type(row)
+                        )
+                    row_fields = None
+                if converters is None or row_fields != fields:
+                    if (
+                        field_list
+                        and row_fields is not None
+                        and set(field_list)
+                        != set(row_fields).intersection(self.heading.names)
+                    ):
+                        raise DataJointError(
+                            "Attempt to insert rows with different fields."
+                        )
+                    # extra fields are only reported for the first row
+                    names, get_values, converters, packs, uploads = (
+                        self.__make_insert_plan(
+                            row_fields, ignore_extra_fields or bool(field_list)
                         )
                     )
-            except TypeError:
-                raise DataJointError("Datatype %s cannot be inserted" % type(row))
-            else:
-                attributes = [
-                    self.__make_placeholder(name, value, ignore_extra_fields)
-                    for name, value in zip(self.heading, row)
-                ]
-        if ignore_extra_fields:
-            attributes = [a for a in attributes if a is not None]
-
-        assert len(attributes), "Empty tuple"
-        row_to_insert = dict(zip(("names", "placeholders", "values"), zip(*attributes)))
-        if not field_list:
-            # first row sets the composition of the field list
-            field_list.extend(row_to_insert["names"])
-        else:
-            #  reorder attributes in row_to_insert to match field_list
-            order = list(row_to_insert["names"].index(field) for field in field_list)
-            row_to_insert["names"] = list(row_to_insert["names"][i] for i in order)
-            row_to_insert["placeholders"] = list(
-                row_to_insert["placeholders"][i] for i in order
-            )
-            row_to_insert["values"] = list(row_to_insert["values"][i] for i in order)
-        return row_to_insert
+                    fields = row_fields
+                    if not field_list:
+                        # first row sets the composition of the field list
+                        field_list.extend(names)
+                    elif field_list != names:
+                        raise DataJointError(
+                            "Attempt to insert rows with different fields."
+                        )
+                    if staged is None:
+                        uploads = frozenset()
+                    if pack_workers == 1:
+                        packs = frozenset()
+                    if packs and pack_executor is None:
+                        pack_executor = ThreadPoolExecutor(max_workers=pack_workers)
+                        pack = pack_executor.submit
+                    if upload_workers > 1 and uploads and upload_executor is None:
+                        upload_executor = ThreadPoolExecutor(max_workers=upload_workers)
+                        upload = upload_executor.submit
+                    concurrent = bool(packs or upload_executor and uploads)
+                values = get_values(row)
+                if concurrent:
+                    pending.append(
+                        [
+                            (
+                                upload(convert, v, staged)
+                                if i in uploads
+                                else pack(convert, v) if i in packs else convert(v)
+                            )
+                            for i, (convert, v) in enumerate(zip(converters, values))
+                        ]
+                    )
+                    # keep the workers busy while bounding the number of rows in flight
+                    while len(pending) > window:
+                        yield _collect_row(pending.popleft())
+                else:
+                    while pending:
+                        yield _collect_row(pending.popleft())
+                    if uploads:
+                        converted = (
+                            convert(v, staged) if i in uploads else convert(v)
+                            for i, (convert, v) in enumerate(zip(converters, values))
+                        )
+                    else:
+                        converted = (
+                            convert(v) for convert, v in zip(converters, values)
+                        )
+                    yield tuple(zip(*converted))
+            while pending:
+                yield _collect_row(pending.popleft())
+        finally:
+            for executor in (pack_executor, upload_executor):
+                if executor is not None:
+                    executor.shutdown(cancel_futures=True)
 
 
 def lookup_class_name(name, context, depth=3):
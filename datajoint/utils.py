@@ -108,13 +108,17 @@ def safe_write(filepath, blob):
     A two-step write.
 
     :param filename: full path
-    :param blob: binary data
+    :param blob: binary data or a binary file object to copy from
     """
     filepath = Path(filepath)
     if not filepath.is_file():
         filepath.parent.mkdir(parents=True, exist_ok=True)
         temp_file = filepath.with_suffix(filepath.suffix + ".saving")
-        temp_file.write_bytes(blob)
+        if hasattr(blob, "read"):
+            with temp_file.open("wb") as f:
+                shutil.copyfileobj(blob, f, 1 << 20)
+        else:
+            temp_file.write_bytes(blob)
         temp_file.rename(filepath)
 
 
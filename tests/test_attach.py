@@ -43,6 +43,18 @@ def test_attach_attributes(schema_ext, minio_client, tmpdir_factory):
     assert p1 == path1[0]
     assert p2 == path2[0]
 
+    # concurrent downloads resolve to the same files
+    _, cpath1, cpath2 = table.fetch(
+        "KEY",
+        "img",
+        "txt",
+        download_path=download_folder,
+        order_by="KEY",
+        download_workers=4,
+    )
+    assert list(cpath1) == list(path1)
+    assert list(cpath2) == list(path2)
+
 
 def test_return_string(schema_ext, minio_client, tmpdir_factory):
     """Test returning string on fetch"""
@@ -1,7 +1,10 @@
+import io
+import os
 import timeit
 import uuid
 from datetime import datetime
 from decimal import Decimal
+from types import SimpleNamespace
 
 import numpy as np
 import pytest
@@ -9,7 +12,7 @@ from numpy.testing import assert_array_equal
 from pytest import approx
 
 import datajoint as dj
-from datajoint.blob import pack, unpack
+from datajoint.blob import pack, pack_to, unpack, unpack_from
 
 from .schema import Longblob
 
@@ -180,6 +183,277 @@ def test_complex():
     assert_array_equal(x, unpack(pack(x)), "Arrays do not match!")
 
 
+def test_unpack_zero_copy():
+    x = np.random.randn(200, 30)
+    blob = pack(x, compress=False)
+    for buffer in (blob, memoryview(blob)):
+        y = unpack(buffer)
+        assert_array_equal(x, y)
+        assert not y.flags.writeable
+        assert np.shares_memory(y, np.frombuffer(blob, dtype=np.uint8))
+
+    z = np.float32(np.random.randn(4, 5)) + 1j * np.float32(np.random.randn(4, 5))
+    y = unpack(memoryview(pack(z)))
+    assert y.dtype == np.complex64
+    assert_array_equal(z, y)
+
+    x = {"name": "zero-copy", "values": [1, b"raw", np.arange(3)]}
+    y = unpack(memoryview(pack(x)))
+    assert y["name"] == x["name"] and y["values"][:2] == x["values"][:2]
+    assert_array_equal(y["values"][2], x["values"][2])
+
+
+@pytest.mark.parametrize("codec", ["zlib", "zstd", "lz4", "blosc"])
+def test_codecs(codec):
+    pytest.importorskip(
+        {"zlib": "zlib", "zstd": "zstandard", "lz4": "lz4", "blosc": "blosc"}[codec]
+    )
+    x = np.tile(np.arange(100.0), (50, 1))
+    for level in (None, 1):
+        blob = pack(x, codec=codec, level=level)
+        assert blob.startswith(dj.blob.codecs[codec][0])
+        assert_array_equal(x, unpack(blob))
+    with dj.config(blob__codec=codec):
+        assert pack(x).startswith(dj.blob.codecs[codec][0])
+    with pytest.raises(dj.DataJointError):
+        pack(x, codec="nonexistent")
+
+
+@pytest.mark.parametrize(
+    "filters", [["shuffle"], ["bitshuffle"], ["delta"], ["delta", "shuffle"]]
+)
+def test_filters(filters):
+    rng = np.random.default_rng(0)
+    for x in (
+        np.cumsum(rng.integers(-5, 5, size=(1000, 3)), axis=0).astype(np.int16),
+        rng.standard_normal((37, 5)).astype(np.float32),
+        rng.integers(0, 2**63, size=11, dtype=np.uint64),
+        rng.standard_normal(9) + 1j * rng.standard_normal(9),
+        np.arange(10).astype("datetime64[s]"),
+        np.array([7], dtype=np.int8),
+    ):
+        y = unpack(pack(x, filters=filters))
+        assert x.dtype == y.dtype
+        assert_array_equal(x, y)
+    with dj.config(blob__filters=filters):
+        assert_array_equal(unpack(pack(x)), x)
+    with pytest.raises(dj.DataJointError):
+        pack(x, filters=["nonexistent"])
+
+
+def test_chunked_arrays():
+    x = np.random.randn(1000, 4)
+    blob = pack(x, chunk_size=1000)
+    assert blob.startswith(b"dj0\0c")
+    assert_array_equal(x, unpack(blob))
+
+    reads = []
+
+    def read(offset, size):
+        reads.append(size)
+        return blob[offset:] if size is None else blob[offset : offset + size]
+
+    assert_array_equal(x[100:130], dj.blob.unpack_slice(read, np.s_[100:130]))
+    assert None not in reads and sum(reads) < len(blob) // 4
+    for index in (np.s_[7], np.s_[-3:], np.s_[::-9], (np.s_[5:9], 1)):
+        assert_array_equal(x[index], dj.blob.unpack_slice(read, index))
+    with pytest.raises(IndexError):
+        dj.blob.unpack_slice(read, 1000)
+
+    # arrays smaller than chunk_size and other blobs are not chunked
+    assert not pack(x[:10], chunk_size=1000).startswith(b"dj0\0c")
+    blob = pack(x)
+    assert_array_equal(x[3:5], dj.blob.unpack_slice(read, np.s_[3:5]))
+
+
+def test_inspect():
+    x = np.zeros((300, 50), dtype=np.float32)
+    blob = pack(x)
+    info = dj.blob.inspect(blob)
+    assert info["type"] == "array" and info["codec"] == "zlib"
+    assert info["shape"] == x.shape and info["dtype"] == x.dtype
+    assert info["stored_size"] == len(blob) < info["size"]
+
+    info = dj.blob.inspect(pack(np.arange(10.0), chunk_size=16))
+    assert info["shape"] == (10,) and info["chunks"] == 5
+    assert dj.blob.inspect(pack([1, 2, 3]))["length"] == 3
+    assert dj.blob.inspect(pack("text"))["type"] == "str"
+    assert dj.blob.inspect(None) is None
+
+    # the beginning of an uncompressed blob suffices
+    blob = pack(np.ones((20, 30)), compress=False)
+    info = dj.blob.inspect(blob[:100], stored_size=len(blob))
+    assert info["size"] == len(blob) and info["shape"] == (20, 30)
+
+
+def test_nested_containers():
+    cell = np.empty((100, 20), dtype=object)
+    for i in range(cell.size):
+        cell.flat[i] = float(i)
+    x = [
+        {"cell": cell.view(dj.blob.MatCell), "n": k, "t": (k, str(k))} for k in range(5)
+    ]
+    y = unpack(pack(x))
+    assert len(y) == len(x)
+    for a, b in zip(x, y):
+        assert a["n"] == b["n"] and a["t"] == b["t"]
+        assert_array_equal(a["cell"].astype(float), b["cell"])
+
+
+@pytest.mark.parametrize("codec", ["zlib", "zstd", "lz4", "blosc"])
+def test_pack_to_unpack_from(codec, tmp_path):
+    pytest.importorskip(
+        {"zlib": "zlib", "zstd": "zstandard", "lz4": "lz4", "blosc": "blosc"}[codec]
+    )
+    x = np.random.randint(0, 50, (300, 200)).astype(np.float64)
+    obj = {"x": x, "xt": x.T[::2], "z": x[:10] + 1j, "s": "text"}
+    f = io.BytesIO(b"header")
+    f.seek(0, io.SEEK_END)
+    size = pack_to(f, obj, codec=codec)
+    blob = f.getvalue()[6:]
+    assert size == len(blob) < x.nbytes
+    if codec in ("zlib", "zstd"):
+        assert blob == pack(obj, codec=codec)
+    filepath = tmp_path / "blob"
+    filepath.write_bytes(blob)
+    for compress in (False, True):
+        with filepath.open("r+b") as f:
+            f.truncate()
+            pack_to(f, obj, compress=compress, codec=codec)
+        with filepath.open("rb") as f:
+            y = unpack_from(f)
+        assert_array_equal(y["x"], x)
+        assert_array_equal(y["xt"], x.T[::2])
+        assert_array_equal(y["z"], x[:10] + 1j)
+        assert y["s"] == "text"
+    assert unpack_from(io.BytesIO(pack("incompressible"))) == "incompressible"
+
+
+class _PipeResponse(io.RawIOBase):
+    """a stream whose file descriptor is not the data's file, like an HTTP response"""
+
+    def __init__(self, data, fd):
+        self._data = io.BytesIO(data)
+        self._fd = fd
+
+    def readable(self):
+        return True
+
+    def readinto(self, b):
+        return self._data.readinto(b)
+
+    def fileno(self):
+        return self._fd
+
+    def tell(self):
+        return 0
+
+
+def test_unpack_from_stream():
+    """uncompressed blobs are read from streams whose size is unknown"""
+    x = np.random.randn(7, 5)
+    blob = pack(x, compress=False)
+    assert blob.startswith(b"mYm\0")
+    read_fd, write_fd = os.pipe()
+    try:
+        with _PipeResponse(blob, read_fd) as response:
+            assert_array_equal(unpack_from(response), x)
+        os.write(write_fd, blob)
+        os.close(write_fd)
+        write_fd = None
+        with open(read_fd, "rb", closefd=False) as pipe:
+            assert_array_equal(unpack_from(pipe), x)
+    finally:
+        os.close(read_fd)
+        if write_fd is not None:
+            os.close(write_fd)
+
+
+def test_compact_sequences(monkeypatch):
+    values = (
+        [float(i) for i in range(1000)],
+        list(range(-500, 500)),
+        tuple(range(10)),
+        [True, False, True],
+        [2**70, 1],  # exceeds 64 bits
+        [1, 1.0, True],  # mixed types
+        [np.float64(1.5)] * 3,
+        [],
+    )
+    x = [float(i) for i in range(1000)]
+    # the compact encoding is opt-in
+    blob = pack(x, compress=False)
+    assert blob.startswith(b"dj0\0\2")  # the list encoding of earlier versions
+    for v in values:
+        assert unpack(pack(v)) == v
+    with dj.config(blob__compact_sequences=True):
+        for v in values:
+            y = unpack(pack(v))
+            assert y == v and type(y) is type(v)
+            assert [type(a) for a in y] == [type(a) for a in v]
+        blob = pack(x, compress=False)
+        assert unpack(pack((1.0, 2.0))) == (1.0, 2.0)
+    assert len(blob) < 8100
+    assert dj.blob.inspect(blob)["type"] == "list"
+    assert dj.blob.inspect(blob)["dtype"] == np.float64
+    assert unpack(blob) == x
+
+    # readers that do not support the compact encoding fail cleanly
+    monkeypatch.delitem(dj.blob.Blob._readers, 7)
+    with pytest.raises(dj.DataJointError, match="Unknown data structure code"):
+        unpack(blob)
+
+
+def test_sparse():
+    sparse = pytest.importorskip("scipy.sparse")
+    x = sparse.random(300, 200, density=0.01, random_state=0, format="coo")
+    for cls in (
+        sparse.csc_matrix,
+        sparse.csr_matrix,
+        sparse.coo_matrix,
+        sparse.lil_matrix,
+        sparse.csr_array,
+        sparse.coo_array,
+    ):
+        for dtype in (np.float64, np.int32, np.complex128, np.bool_):
+            m = cls(x.astype(dtype))
+            y = unpack(pack(m))
+            assert type(y) is cls and y.dtype == m.dtype and y.shape == m.shape
+            assert_array_equal(y.toarray(), m.toarray())
+
+    # MATLAB-compatible sparse matrices use the original mYm protocol
+    blob = pack(sparse.csc_matrix(x), compress=False)
+    assert blob.startswith(b"mYm\0P")
+    assert len(blob) < 0.1 * x.toarray().nbytes
+    info = dj.blob.inspect(blob)
+    assert info["type"] == "sparse" and info["shape"] == (300, 200)
+    assert unpack(pack(sparse.csr_matrix((4, 5)))).nnz == 0
+
+
+def test_pickle():
+    x = SimpleNamespace(
+        data=np.tile(np.arange(1000.0), 50), noise=np.random.rand(300), name="x"
+    )
+    with pytest.raises(dj.DataJointError):
+        pack(x)
+    with dj.config(blob__pickle=True):
+        for compress in (True, False):
+            blob = pack(x, compress=compress)
+            assert dj.blob.inspect(blob)["type"] == "pickle"
+            y = unpack(blob)
+            assert_array_equal(y.data, x.data)
+            assert_array_equal(y.noise, x.noise)
+            assert y.name == "x"
+        # the buffers of uncompressed segments are not copied
+        assert not y.data.flags.owndata and not y.data.flags.writeable
+        # segments are compressed individually rather than the whole blob
+        compressed = pack(x)
+        assert compressed.startswith(b"dj0\0p")
+        assert len(compressed) < 0.5 * x.data.nbytes
+    with pytest.raises(dj.DataJointError, match="pickle"):
+        unpack(blob)
+
+
 def test_insert_longblob(schema_any):
     insert_dj_blob = {"id": 1, "data": [1, 2, 3]}
     Longblob.insert1(insert_dj_blob)
@@ -192,6 +466,15 @@ def test_insert_longblob(schema_any):
     (Longblob & "id=1").delete()
 
 
+def test_insert_pack_workers(schema_any):
+    rows = [dict(id=i, data=np.random.randn(100, 10)) for i in range(20)]
+    Longblob.insert(rows, pack_workers=4)
+    fetched = (Longblob & "id < 20").fetch("data", order_by="id")
+    for row, data in zip(rows, fetched):
+        assert_array_equal(row["data"], data)
+    (Longblob & "id < 20").delete()
+
+
 def test_insert_longblob_32bit(schema_any, enable_feature_32bit_dims):
     query_32_blob = (
         "INSERT INTO djtest_test1.longblob (id, data) VALUES (1, "
@@ -254,3 +537,9 @@ def test_datetime_serialization_speed():
 
     # The time savings were much greater (x1000) but use x10 for testing
     assert optimized_exe_time * 10 < baseline_exe_time
+
+
+def test_nested_serialization():
+    obj = {str(i): [i, float(i), None, (True, "x")] for i in range(2000)}
+    assert unpack(pack(obj)) == obj
+    assert unpack(pack(obj, compress=False)) == obj
@@ -427,3 +427,36 @@ def test_add_hidden_timestamp_disabled(disable_add_hidden_timestamp, schema_any)
     ), msg
     assert not any(a.is_hidden for a in Experiment().heading._attributes.values()), msg
     assert not any(a.is_hidden for a in Experiment().heading.attributes.values()), msg
+
+
+def test_blob_codec(schema_any):
+    class CompressedBlob(dj.Manual):
+        definition = """
+        id : int
+        ---
+        data : longblob  # [codec=zstd:5] compressed with zstd
+        plain : longblob  # default compression
+        """
+
+    class InvalidCodec(dj.Manual):
+        definition = """
+        id : int
+        ---
+        data : longblob  # [codec=nonexistent] unknown codec
+        """
+
+    class CodecOnNumber(dj.Manual):
+        definition = """
+        id : int
+        ---
+        value : float  # [codec=zstd] not a blob
+        """
+
+    schema_any(CompressedBlob)
+    heading = CompressedBlob().heading
+    assert heading["data"].codec == "zstd"
+    assert heading["data"].compression_level == 5
+    assert heading["plain"].codec is None
+    for table in (InvalidCodec, CodecOnNumber):
+        with pytest.raises(dj.DataJointError):
+            schema_any(table)
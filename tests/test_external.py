@@ -1,10 +1,12 @@
+import io
 import os
 
 import numpy as np
+import pytest
 from numpy.testing import assert_array_equal
 
 import datajoint as dj
-from datajoint.blob import pack, unpack
+from datajoint.blob import pack, pack_to, unpack, unpack_from
 from datajoint.external import ExternalTable
 
 from .schema_external import Simple, SimpleRemote
@@ -34,6 +36,137 @@ def test_external_put(schema_ext, mock_stores, mock_cache):
     assert_array_equal(input_, output_)
 
 
+def test_external_fetch_tracking(schema_ext, mock_stores, mock_cache):
+    """
+    batched tracking lookups of several external objects
+    """
+    ext = ExternalTable(
+        schema_ext.connection, store="raw", database=schema_ext.database
+    )
+    blobs = [pack(np.random.randn(3, i + 1)) for i in range(5)]
+    hashes = [ext.put(b) for b in blobs]
+    tracking = ext.fetch_tracking(hashes + hashes[:2], "size")
+    assert set(tracking) == set(hashes)
+    assert all(tracking[h]["size"] == len(b) for h, b in zip(hashes, blobs))
+    assert ext.fetch_tracking([]) == {}
+
+
+def test_external_put_stream(schema_ext, mock_stores, mock_cache):
+    """
+    streaming a blob into and out of external storage
+    """
+    for store in ("raw", "share"):
+        ext = ExternalTable(
+            schema_ext.connection, store=store, database=schema_ext.database
+        )
+        input_ = np.random.randn(300, 20)
+        f = io.BytesIO()
+        pack_to(f, input_)
+        hash1 = ext.put_stream(f)
+        assert hash1 == ext.put(pack(input_))
+        assert (ext & {"hash": hash1}).fetch1("size") == len(f.getvalue())
+        with ext.open(hash1) as stream:
+            assert_array_equal(unpack_from(stream), input_)
+        with ext.open(hash1) as stream:  # from the cache
+            assert_array_equal(unpack_from(stream), input_)
+
+
+def test_external_insert_tracking(schema_ext, mock_stores, mock_cache, monkeypatch):
+    """
+    concurrent uploads of an insert with tracking entries recorded in one query
+    """
+    ext = schema_ext.external["local"]
+    values = [np.random.randn(10, i + 1) for i in range(20)]
+    initial_length = len(ext)
+    queries = []
+    query = ext.connection.query
+
+    def spy(sql, *args, **kwargs):
+        queries.append(sql)
+        return query(sql, *args, **kwargs)
+
+    monkeypatch.setattr(ext.connection, "query", spy)
+    Simple.insert(
+        (dict(simple=100 + i, item=v) for i, v in enumerate(values)),
+        upload_workers=4,
+    )
+    monkeypatch.undo()
+    assert sum(ext.full_table_name in q and "INSERT" in q for q in queries) == 1
+    # the objects already stored are looked up with one query
+    assert sum(ext.full_table_name in q and "SELECT" in q for q in queries) == 1
+    assert len(ext) == initial_length + len(values)
+    fetched = (Simple & "simple >= 100").fetch("item", order_by="simple")
+    for f, v in zip(fetched, values):
+        assert_array_equal(f, v)
+    (Simple & "simple >= 100").delete()
+
+
+def test_external_tracking_after_rollback(schema_ext, mock_stores, mock_cache):
+    """
+    objects uploaded by a failed insert remain tracked after the rollback
+    """
+    ext = schema_ext.external["local"]
+    initial_length = len(ext)
+    rows = [dict(simple=300 + i % 2, item=np.random.randn(3, 4)) for i in range(3)]
+    with pytest.raises(dj.errors.DuplicateError):
+        Simple.insert(rows, batch_size=1)
+    assert not Simple & "simple >= 300"
+    assert len(ext) == initial_length + len(rows)
+
+
+def test_external_shared_blob_copies(schema_ext, mock_stores, mock_cache):
+    """
+    rows that reference the same external blob receive independent arrays
+    """
+    value = np.random.randn(4, 3)
+    Simple.insert([dict(simple=200, item=value), dict(simple=201, item=value)])
+    first, second = (Simple & "simple >= 200").fetch("item", order_by="simple")
+    first[0, 0] += 1
+    assert_array_equal(second, value)
+    (Simple & "simple >= 200").delete()
+
+
+def test_external_blob_info_stream(schema_ext, mock_stores, mock_cache):
+    """
+    describing external blobs queries the tracking table and cannot be streamed
+    """
+    with pytest.raises(dj.DataJointError):
+        Simple.fetch(stream=True, blob_info=True)
+
+
+def test_external_skip_existing(schema_ext, mock_stores, mock_cache, monkeypatch):
+    """
+    objects that are already tracked and stored are not uploaded again
+    """
+    ext = ExternalTable(
+        schema_ext.connection, store="raw", database=schema_ext.database
+    )
+    uploads = []
+    upload = ext._upload_buffer
+
+    def spy(buffer, external_path):
+        uploads.append(external_path)
+        return upload(buffer, external_path)
+
+    monkeypatch.setattr(ext, "_upload_buffer", spy)
+    blob = pack(np.random.randn(5, 6))
+    hash1 = ext.put(blob)
+    assert ext.put(blob) == hash1
+    assert len(uploads) == 1
+    with dj.config(external__skip_existing=False):
+        ext.put(blob)
+    assert len(uploads) == 2
+
+    # a tracked object missing from the store is uploaded again unless the store is trusted
+    ext._remove_external_file(ext._make_uuid_path(hash1))
+    with dj.config(external__verify_existing=False):
+        ext.put(blob)
+    assert len(uploads) == 2
+    ext.put(blob)
+    assert len(uploads) == 3
+    assert_array_equal(unpack(ext.get(hash1)), unpack(blob))
+
+
 class TestLeadingSlash:
     def test_s3_leading_slash(self, schema_ext, mock_stores, mock_cache, minio_client):
         """
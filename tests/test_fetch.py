@@ -1,6 +1,7 @@
 import decimal
 import io
 import itertools
+import json
 import logging
 import os
 import warnings
@@ -12,6 +13,7 @@ import pandas
 import pytest
 
 import datajoint as dj
+from datajoint.fetch import LazyBlob
 
 from . import schema
 
@@ -372,3 +374,159 @@ def test_backslash(schema_any):
     q = schema.Parent & dict(name=expected)
     assert q.fetch1("name") == expected
     q.delete()
+
+
+def test_fetch_stream(lang, languages):
+    """Test streaming fetch in batches through an unbuffered cursor"""
+    order_by = ("language", "name DESC")
+    expected = lang.fetch(order_by=order_by)
+    batches = list(lang.fetch(stream=True, batch_size=4, order_by=order_by))
+    assert [len(b) for b in batches] == [4, 2]
+    assert all(isinstance(b, np.ndarray) for b in batches)
+    np.testing.assert_array_equal(np.concatenate(batches), expected)
+
+    batches = list(lang.iter_batches(batch_size=5, as_dict=True, order_by=order_by))
+    assert [len(b) for b in batches] == [5, 1]
+    assert sum(batches, []) == lang.fetch(as_dict=True, order_by=order_by)
+
+    names = list(lang.iter_batches("name", batch_size=2, order_by=order_by))
+    assert len(names) == 3
+    np.testing.assert_array_equal(np.concatenate(names), expected["name"])
+
+    for batch in lang.iter_batches(batch_size=3, format="frame"):
+        assert isinstance(batch, pandas.DataFrame)
+        assert list(batch.index.names) == lang.primary_key
+    # the connection is available again after the stream is exhausted
+    assert len(lang) == len(languages)
+
+
+def test_fetch_stream_blocks_queries(lang, languages):
+    """Queries issued while a stream is open raise instead of truncating the stream"""
+    stream = lang.fetch(stream=True, batch_size=2)
+    assert len(next(stream)) == 2
+    with pytest.raises(dj.DataJointError):
+        len(lang)
+    assert sum(len(b) for b in stream) == len(languages) - 2
+    assert len(lang) == len(languages)
+
+
+def test_fetch_stream_batch_size_requires_stream(lang):
+    with pytest.raises(dj.DataJointError):
+        lang.fetch(batch_size=3)
+
+
+def test_fetch_column_types(schema_any):
+    """Numeric columns are filled with their native dtypes, nulls included"""
+    table = schema.NullableNumbers()
+    table.insert([(k, k / 2, k / 4, k) for k in range(5)] + [(5, None, None, None)])
+    result = table.fetch(order_by="key")
+    assert result.dtype["key"] == np.int64
+    assert result.dtype["fvalue"] == np.float64
+    assert result.dtype["ivalue"] == object
+    np.testing.assert_array_equal(result["key"], np.arange(6))
+    assert np.isnan(result["dvalue"][-1])
+    assert result["ivalue"][-1] is None
+    frame = table.fetch(format="frame", order_by="key")
+    np.testing.assert_array_equal(frame["dvalue"].values, result["dvalue"])
+    assert frame.index.names == ["key"]
+    table.delete_quick()
+
+
+def test_fetch_arrow(subject):
+    pa = pytest.importorskip("pyarrow")
+    table = subject.fetch(format="arrow", order_by="subject_id")
+    assert isinstance(table, pa.Table)
+    assert table.column_names == subject.heading.names
+    assert pa.types.is_dictionary(table.schema.field("species").type)
+    expected = subject.fetch(order_by="subject_id")
+    np.testing.assert_array_equal(
+        table.column("subject_id").to_numpy(), expected["subject_id"]
+    )
+    assert table.column("species").to_pylist() == list(expected["species"])
+
+
+def test_fetch_arrow_blobs(schema_any):
+    pa = pytest.importorskip("pyarrow")
+    schema.Longblob.insert(
+        [dict(id=i, data=np.arange(6.0).reshape(2, 3) * i) for i in range(3)]
+    )
+    table = schema.Longblob.fetch(format="arrow", order_by="id")
+    field = table.schema.field("data")
+    assert pa.types.is_fixed_size_list(field.type)
+    assert json.loads(field.metadata[b"shape"]) == [2, 3]
+    np.testing.assert_array_equal(table.column("data")[2].values, np.arange(6.0) * 2)
+
+    schema.Longblob.insert1(dict(id=3, data=np.arange(2.0)))
+    table = schema.Longblob.fetch(format="arrow", order_by="id")
+    assert pa.types.is_list(table.schema.field("data").type)
+    assert table.column("data")[3].as_py() == [0.0, 1.0]
+
+
+def test_fetch_polars(subject):
+    polars = pytest.importorskip("polars")
+    frame = subject.fetch(format="polars")
+    assert isinstance(frame, polars.DataFrame)
+    assert frame.columns == subject.heading.names
+    assert len(frame) == len(subject)
+
+
+def test_fetch_decode_workers(schema_any):
+    """Blobs decoded on a thread pool are returned in the original order"""
+    schema.Longblob.insert(
+        [dict(id=i, data=np.random.randn(i + 1, 300)) for i in range(20)]
+    )
+    expected = schema.Longblob.fetch(order_by="id")
+    result = schema.Longblob.fetch(order_by="id", decode_workers=4)
+    for a, b in zip(expected["data"], result["data"]):
+        np.testing.assert_array_equal(a, b)
+    with dj.config(fetch__decode_workers=3):
+        rows = schema.Longblob.fetch(order_by="id", as_dict=True)
+    assert [r["id"] for r in rows] == list(range(20))
+    for row, data in zip(rows, expected["data"]):
+        np.testing.assert_array_equal(row["data"], data)
+
+
+def test_fetch_lazy_blobs(schema_any):
+    """Lazy blobs are unpacked only when accessed"""
+    schema.Longblob.insert([dict(id=i, data=np.arange(i + 1.0)) for i in range(3)])
+    result = schema.Longblob.fetch(order_by="id", lazy_blobs=True)
+    assert all(isinstance(b, LazyBlob) and not b.loaded for b in result["data"])
+    np.testing.assert_array_equal(result["data"][2].load(), np.arange(3.0))
+    assert result["data"][2].loaded and not result["data"][1].loaded
+    assert len(result["data"][1]) == 2 and result["data"][1].shape == (2,)
+
+    row = (schema.Longblob & "id=1").fetch1(lazy_blobs=True)
+    assert isinstance(row["data"], LazyBlob)
+    np.testing.assert_array_equal(np.asarray(row["data"]), np.arange(2.0))
+
+    with pytest.raises(dj.DataJointError):
+        schema.Longblob.fetch(format="arrow", lazy_blobs=True)
+
+
+def test_fetch1_blob_slice(schema_any):
+    """Slices of chunked blobs are read without fetching the entire blob"""
+    x = np.random.randn(1000, 3)
+    with dj.config(blob__chunk_size=2000):
+        schema.Longblob.insert1(dict(id=1, data=x))
+    schema.Longblob.insert1(dict(id=2, data=x))
+    for key in ("id=1", "id=2"):
+        query = schema.Longblob & key
+        np.testing.assert_array_equal(
+            query.fetch1("data", blob_slice=np.s_[100:200]), x[100:200]
+        )
+        np.testing.assert_array_equal(query.fetch1("data", blob_slice=-1), x[-1])
+        np.testing.assert_array_equal(query.fetch1("data"), x)
+    with pytest.raises(dj.DataJointError):
+        (schema.Longblob & "id=1").fetch1("id", blob_slice=np.s_[:10])
+
+
+def test_fetch_blob_info(schema_any):
+    """Blobs are described without unpacking them"""
+    schema.Longblob.insert(
+        [dict(id=i, data=np.random.randn(i + 1, 200)) for i in range(3)]
+    )
+    info = schema.Longblob.fetch("data", order_by="id", blob_info=True)
+    assert [i["shape"] for i in info] == [(1, 200), (2, 200), (3, 200)]
+    assert all(i["type"] == "array" and i["dtype"] == np.float64 for i in info)
+    with pytest.raises(dj.DataJointError):
+        schema.Longblob.fetch(format="arrow", blob_info=True)
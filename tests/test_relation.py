@@ -125,6 +125,101 @@ def test_insert_pandas_userframe(test, test2):
     assert len(test2) == n
 
 
+def test_insert_field_order(subject):
+    """Tests inserting rows that list their fields in different orders"""
+    subject.insert(
+        [
+            dict(
+                subject_id=6000,
+                real_id="a",
+                date_of_birth="2020-01-01",
+                subject_notes="",
+            ),
+            dict(
+                subject_notes="b",
+                date_of_birth="2020-01-02",
+                real_id="b",
+                subject_id=6001,
+            ),
+            dict(
+                subject_id=6002,
+                subject_notes="",
+                real_id="c",
+                date_of_birth="2020-01-03",
+            ),
+        ]
+    )
+    real_id, notes = (subject & "subject_id >= 6000").fetch(
+        "real_id", "subject_notes", order_by="subject_id"
+    )
+    assert list(real_id) == ["a", "b", "c"] and list(notes) == ["", "b", ""]
+    (subject & "subject_id >= 6000").delete_quick()
+
+
+def test_insert_columns(schema_any, subject):
+    """Tests the vectorized insert of data frames, record arrays, and Arrow tables"""
+    table = schema.NullableNumbers()
+    rng = np.random.default_rng(0)
+    frame = pandas.DataFrame(
+        dict(
+            key=np.arange(1000),
+            fvalue=rng.standard_normal(1000).astype(np.float32),
+            dvalue=rng.standard_normal(1000),
+            ivalue=rng.integers(-1000, 1000, 1000),
+        )
+    )
+    frame.loc[::7, "dvalue"] = np.nan
+    sources = [frame, frame.to_records(index=False)]
+    try:
+        import pyarrow
+    except ImportError:
+        pass
+    else:
+        sources.append(pyarrow.Table.from_pandas(frame))
+    for rows in sources:
+        table.insert(rows, batch_size=300)
+        f, d, i = table.fetch("fvalue", "dvalue", "ivalue", order_by="key")
+        assert np.allclose(f, frame.fvalue, rtol=1e-5)
+        np.testing.assert_array_equal(d, frame.dvalue)
+        np.testing.assert_array_equal(i, frame.ivalue)
+        table.delete_quick()
+
+    names = ["o'k\\%d%%s" % k for k in range(10)]
+    subject.insert(
+        pandas.DataFrame(
+            dict(
+                subject_id=np.arange(5000, 5010),
+                real_id=names,
+                date_of_birth="2020-01-01",
+                subject_notes="",
+            )
+        )
+    )
+    assert (
+        list((subject & "subject_id >= 5000").fetch("real_id", order_by="subject_id"))
+        == names
+    )
+    (subject & "subject_id >= 5000").delete_quick()
+
+
+def test_insert_columns_string_nan(subject):
+    """NaN in a string column is not inserted as NULL, as in inserts row by row"""
+    frame = pandas.DataFrame(
+        dict(
+            subject_id=[5100, 5101],
+            real_id=["a", "b"],
+            date_of_birth="2020-01-01",
+            subject_notes=["x", np.nan],
+        )
+    )
+    with pytest.raises(Exception) as by_column:
+        subject.insert(frame)
+    with pytest.raises(Exception) as by_row:
+        subject.insert(frame.to_dict("records"))
+    assert type(by_column.value) is type(by_row.value)
+    assert not subject & "subject_id >= 5100"
+
+
 def test_insert_select_ignore_extra_fields0(test, test_extra):
     """need ignore extra fields for insert select"""
     test_extra.insert1((test.fetch("key").max() + 1, 0, 0))
@@ -238,6 +333,65 @@ def test_not_skip_duplicate(subject):
         subject.insert(tmp, skip_duplicates=False)
 
 
+def test_insert_batches(subject):
+    """Tests inserts split into several statements"""
+    rows = [
+        dict(subject_id=i, real_id=str(i), date_of_birth="2020-01-01", subject_notes="")
+        for i in range(1000, 1010)
+    ]
+    subject.insert(rows, batch_size=3, display_progress=True)
+    assert len(subject & "subject_id >= 1000") == 10
+    (subject & "subject_id >= 1000").delete_quick()
+
+    # a failing batch rolls back the entire insert
+    rows[-1] = dict(rows[0], real_id="duplicate")
+    with pytest.raises(dj.errors.DuplicateError):
+        subject.insert(rows, batch_size=3)
+    assert not subject & "subject_id >= 1000"
+
+    # unless each batch is committed on its own
+    with pytest.raises(dj.errors.DuplicateError):
+        subject.insert(rows, batch_size=3, commit_batches=True)
+    assert len(subject & "subject_id >= 1000") == 9
+    (subject & "subject_id >= 1000").delete_quick()
+
+    with subject.connection.transaction:
+        with pytest.raises(dj.DataJointError):
+            subject.insert(rows, commit_batches=True)
+
+
+def test_insert_stream(subject, tmp_path):
+    """Tests inserts from generators and CSV files"""
+
+    def generate(n):
+        for i in range(2000, 2000 + n):
+            yield dict(
+                subject_id=i,
+                real_id=str(i),
+                date_of_birth="2020-01-01",
+                subject_notes="",
+            )
+        raise ValueError("source exhausted")
+
+    with pytest.raises(ValueError):
+        subject.insert(generate(25), batch_size=10)
+    assert not subject & "subject_id >= 2000"
+    # rows are sent before the generator is exhausted
+    with pytest.raises(ValueError):
+        subject.insert(generate(25), batch_size=10, commit_batches=True)
+    assert len(subject & "subject_id >= 2000") == 20
+    (subject & "subject_id >= 2000").delete_quick()
+
+    path = tmp_path / "subjects.csv"
+    path.write_text(
+        "subject_id,real_id,date_of_birth,subject_notes\n"
+        + "".join("%d,%d,2020-01-01,csv\n" % (i, i) for i in range(3000, 3005))
+    )
+    subject.insert(path, batch_size=2)
+    assert len(subject & 'subject_notes="csv"') == 5
+    (subject & "subject_id >= 2000").delete_quick()
+
+
 def test_no_error_suppression(test):
     """skip_duplicates=True should not suppress other errors"""
     with pytest.raises(dj.errors.MissingAttributeError):